@@ -1,15 +1,23 @@
-import collections
-from collections import OrderedDict
+from collections.abc import Mapping
 
 
 class ValidationError(Exception):
-    def __init__(self, errors):
-        self.errors = ValidationError.normalise(errors)
+    # Set when errors were collected with a limit (see ErrorCollector)
+    truncated = False
+    processed = None
+
+    def __init__(self, errors, normalised=False):
+        # Errors that are already normalised (e.g. the errors of another
+        # ValidationError) are adopted as they are
+        if normalised:
+            self.errors = errors
+        else:
+            self.errors = ValidationError.normalise(errors)
 
     @staticmethod
     def normalise(errors):
         if isinstance(errors, dict):
-            new_errors = OrderedDict()
+            new_errors = {}
 
             for k, v in errors.items():
                 if isinstance(v, (dict, list)):
@@ -31,63 +39,212 @@ class ValidationError(Exception):
 
         return new_errors
 
-    @staticmethod
-    def _first(errors):
-        r = None
+    def iter_flat(self):
+        """Yields (path, message) for each error, depth first"""
 
-        if isinstance(errors, list):
-            for x in errors:
-                r = ValidationError._first(x)
+        return _iter_flat(self.errors)
 
-                if r is not None:
-                    break
-        elif isinstance(errors, dict):
-            for k, v in errors.items():
-                r = ValidationError._first(v)
+    def first(self):
+        for path, message in self.iter_flat():
+            return (path or None), message
 
-                if r is not None:
-                    if r[0] is None:
-                        path = (k,)
-                    else:
-                        path = (k,) + r[0]
+        return None
 
-                    r = (path, r[1])
-                    break
+    def flatten(self):
+        return list(self.iter_flat())
+
+    def __str__(self):
+        return str(self.errors)
+
+
+class SkipField(Exception):
+    pass
+
+
+class ErrorCollector(object):
+    """Collects the errors reported while validating.
+
+    Containers push the key of each child onto path while validating it,
+    and errors are added at the current path. The collected errors have
+    the same structure as ValidationError.errors.
+
+    Validation stops once max_errors errors have been added, in which case
+    truncated is set. processed is the number of items of the outermost
+    list that were validated.
+    """
+
+    def __init__(self, max_errors=None):
+        self.path = []
+        self.count = 0
+        self.max_errors = max_errors
+        self.truncated = False
+        self.processed = None
+        self._errors = None
+
+    @property
+    def full(self):
+        return self.max_errors is not None and self.count >= self.max_errors
+
+    def add(self, errors):
+        """Add normalised errors at the current path"""
+
+        self.count += 1
+
+        if not self.path:
+            self._errors = _merge_errors(self._errors, errors)
+            return
+
+        if self._errors is None:
+            self._errors = {}
+
+        node = self._errors
+
+        for key in self.path[:-1]:
+            node = node.setdefault(key, {})
+
+        key = self.path[-1]
+        node[key] = _merge_errors(node.get(key), errors)
+
+    @property
+    def errors(self):
+        if self._errors is None:
+            return {}
+
+        return self._errors
+
+    def raise_errors(self):
+        if self.count:
+            e = ValidationError(self.errors, normalised=True)
+            e.truncated = self.truncated
+            e.processed = self.processed
+            raise e
+
+
+def _merge_errors(a, b):
+    if a is None:
+        return b
+    elif isinstance(a, dict) and isinstance(b, dict):
+        for key, value in b.items():
+            a[key] = _merge_errors(a.get(key), value)
+
+        return a
+    elif isinstance(a, list) and isinstance(b, list):
+        return a + b
+    else:
+        return b
+
+
+class ErrorSummary(ErrorCollector):
+    """Collects counts of errors rather than the errors themselves.
+
+    Errors are grouped by field path and message, with the index of the
+    row removed from the path. Up to max_samples row indices are kept for
+    each group, so memory is proportional to the number of distinct errors
+    rather than the number of rows.
+    """
+
+    def __init__(self, max_errors=None, max_samples=3):
+        super(ErrorSummary, self).__init__(max_errors=max_errors)
+        self.max_samples = max_samples
+        self.groups = {}
+
+    def add(self, errors):
+        self.count += 1
+
+        path = self.path
+
+        if path and isinstance(path[0], int):
+            row = path[0]
+            path = path[1:]
         else:
-            r = (None, errors)
+            row = None
 
-        return r
+        for field_path, message in _iter_flat(errors, path):
+            group = self.groups.get((field_path, message))
 
-    def first(self):
-        return ValidationError._first(self.errors)
+            if group is None:
+                group = self.groups[(field_path, message)] = [0, []]
 
-    @staticmethod
-    def _flatten(errors, path=None):
-        flattened_errors = []
+            group[0] += 1
+
+            if row is not None and len(group[1]) < self.max_samples:
+                group[1].append(row)
 
-        if path is None:
-            path = tuple()
+    def summary(self):
+        """Returns (path, message, count, sample rows) for each kind of error"""
 
-        for field_name, field_errors in errors.items():
-            field_path = path + (field_name,)
+        return [
+            (path, message, count, rows)
+            for (path, message), (count, rows) in self.groups.items()
+        ]
 
-            if isinstance(field_errors, collections.Mapping):
-                flattened_field_errors = ValidationError._flatten(
-                    field_errors, path=field_path
+    @property
+    def errors(self):
+        errors = {}
+
+        for path, message, count, rows in self.summary():
+            if not path:
+                path = ("_",)
+
+            if rows:
+                message = "{} ({} rows, first at {})".format(
+                    message, count, ", ".join(str(x) for x in rows)
                 )
-                flattened_errors.extend(flattened_field_errors)
-            else:
-                for field_error in field_errors:
-                    flattened_errors.append((field_path, field_error))
+            elif count > 1:
+                message = "{} ({} rows)".format(message, count)
 
-        return flattened_errors
+            node = errors
 
-    def flatten(self):
-        return ValidationError._flatten(self.errors)
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
 
-    def __str__(self):
-        return str(self.errors)
+            node.setdefault(path[-1], []).append(message)
 
+        return errors
 
-class SkipField(Exception):
-    pass
+
+def _is_mapping(value):
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _iter_flat(errors, path=()):
+    # A stack of iterators is used rather than recursion, so deep trees
+    # don't hit the recursion limit, and each node's path tuple is built
+    # once and shared by all of its messages
+    path = tuple(path)
+
+    if _is_mapping(errors):
+        stack = [(iter(errors.items()), True, path)]
+    elif isinstance(errors, list):
+        stack = [(iter(errors), False, path)]
+    else:
+        yield path, errors
+        return
+
+    while stack:
+        children, is_mapping, prefix = stack[-1]
+
+        for child in children:
+            if is_mapping:
+                key, value = child
+                field_path = prefix + (key,)
+            else:
+                # List indices are not part of the path
+                value = child
+                field_path = prefix
+
+            if isinstance(value, list):
+                # Lists of messages (the common case) are yielded directly
+                if all(isinstance(x, str) for x in value):
+                    for x in value:
+                        yield field_path, x
+                else:
+                    stack.append((iter(value), False, field_path))
+                    break
+            elif not isinstance(value, str) and _is_mapping(value):
+                stack.append((iter(value.items()), True, field_path))
+                break
+            else:
+                yield field_path, value
+        else:
+            stack.pop()
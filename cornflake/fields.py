@@ -1,12 +1,19 @@
+from collections import ChainMap
 from collections.abc import Mapping
+import contextlib
+import contextvars
 import copy
+import itertools
+import re
 import uuid
 from datetime import date, datetime
+from decimal import Decimal
+from types import MappingProxyType
 
 import six
 
 from cornflake.utils import parse_datetime
-from cornflake.exceptions import ValidationError, SkipField
+from cornflake.exceptions import ErrorCollector, ValidationError, SkipField
 
 
 class _empty(object):
@@ -19,12 +26,272 @@ class _empty(object):
 empty = _empty()
 
 
-class Field(object):
-    _creation_counter = 0
+class _invalid(object):
+    def __bool__(self):
+        return False
 
-    error_messages = {
+    __nonzero__ = __bool__
+
+
+# Returned in place of a value that failed validation
+invalid = _invalid()
+
+# Tabs and runs of whitespace (see validators.normalise_whitespace)
+_whitespace_regex = re.compile(r"\s{2,}|\t")
+
+# Keeps track of field declaration order
+_field_counter = itertools.count()
+
+# (root, context) for the current call, used in place of the root's context
+_call_context = contextvars.ContextVar("cornflake_call_context", default=None)
+
+
+@contextlib.contextmanager
+def using_context(root, context):
+    """Use context as the context of root's fields for the duration of a call.
+
+    This lets a serializer that is shared between requests (or threads)
+    see the context of the request it is currently validating. Fields with
+    another root (e.g. a serializer made during the call) keep their own.
+    """
+
+    token = _call_context.set((root, context))
+
+    try:
+        yield context
+    finally:
+        _call_context.reset(token)
+
+
+class ErrorMessages(object):
+    """Descriptor for a field's error messages.
+
+    The messages merged for a class are shared by all of its instances. An
+    instance gets its own layer over them (copy-on-write) when they are
+    first accessed through it, and the class's are read-only.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return MappingProxyType(owner.get_class_error_messages())
+
+        try:
+            return instance._error_messages
+        except AttributeError:
+            messages = ChainMap({}, type(instance).get_class_error_messages())
+            instance._error_messages = messages
+            return messages
+
+    def __set__(self, instance, value):
+        instance._error_messages = value
+
+
+def overrides(obj, base, *names):
+    """True if obj's class overrides any of the named methods of base"""
+
+    cls = type(obj)
+
+    for name in names:
+        if getattr(cls, name) is not getattr(base, name):
+            return True
+
+    return False
+
+
+def collect_items(child, data, collector):
+    """Validate each item of a list with child, collecting the errors"""
+
+    values = []
+    path = collector.path
+    outermost = not path
+
+    for i, x in enumerate(data):
+        path.append(i)
+        value = child.collect_validation(x, collector)
+        path.pop()
+
+        if value is not invalid:
+            values.append(value)
+
+        if outermost:
+            collector.processed = i + 1
+
+        if collector.full:
+            if i + 1 < len(data):
+                collector.truncated = True
+
+            break
+
+    return values
+
+
+def collect_container(
+    field, data, collector, data_type, type_error, collect, finish=None
+):
+    """Validate a list or dict with field, collecting the errors.
+
+    data must be an instance of data_type (or field fails with type_error).
+    collect(data, collector) validates the items and finish(value) runs the
+    field's own validation of them, unless an item was invalid. Returns
+    invalid if the value didn't validate.
+    """
+
+    try:
+        data = field.validate_empty_values(data)
+
+        if data is None:
+            return data
+
+        if not isinstance(data, data_type):
+            field.fail(type_error)
+    except ValidationError as e:
+        collector.add(e.errors)
+        return invalid
+
+    count = collector.count
+    value = collect(data, collector)
+
+    if collector.count != count:
+        return invalid
+
+    if finish is None:
+        return value
+
+    try:
+        return finish(value)
+    except ValidationError as e:
+        collector.add(e.errors)
+        return invalid
+
+
+def can_coerce_many(field):
+    """True if field.coerce_many can stand in for validating each value.
+
+    The field can't change how values are validated, other than by
+    overriding validate, and a coerce_many other than Field's must belong
+    to the class that defines to_internal_value. Validators are checked by
+    coerce_items as they can be added after the field is created.
+    """
+
+    if overrides(
+        field,
+        Field,
+        "run_validation",
+        "collect_validation",
+        "validate_empty_values",
+        "run_validators",
+    ):
+        return False
+
+    coerce_many_class = _defining_class(type(field), "coerce_many")
+
+    return coerce_many_class is Field or coerce_many_class is _defining_class(
+        type(field), "to_internal_value"
+    )
+
+
+def _defining_class(cls, name):
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+
+    return None
+
+
+def coerce_items(child, data):
+    """Validate a list of values with child.coerce_many.
+
+    Returns invalid if the child has validators or any value is null or
+    invalid, in which case the values should be validated one by one.
+    """
+
+    if child.validators or child._trusted or None in data:
+        return invalid
+
+    try:
+        values = child.coerce_many(data)
+
+        if overrides(child, Field, "validate"):
+            validate = child.validate
+            values = [validate(x) for x in values]
+    except ValidationError:
+        return invalid
+
+    return values
+
+
+class Field(object):
+    __slots__ = (
+        "_args",
+        "_kwargs",
+        "_creation_counter",
+        "_context",
+        "_error_messages",
+        "source",
+        "field_name",
+        "required",
+        "default",
+        "default_empty",
+        "read_only",
+        "write_only",
+        "validators",
+        "initial",
+        "parent",
+        "trusted",
+        "_trusted",
+        "_root",
+    )
+
+    _declared_error_messages = {
         "required": "This field is required.",
     }
+    _class_error_messages = dict(_declared_error_messages)
+
+    error_messages = ErrorMessages()
+
+    # Values of exactly these types are already valid internal values, so
+    # trusted fields pass them straight to the validators
+    native_types: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super(Field, cls).__init_subclass__(**kwargs)
+
+        # Move the error messages declared on the class out of the way of
+        # the descriptor (this also covers messages declared on mixins)
+        declared = cls.__dict__.get("error_messages")
+
+        if not isinstance(declared, ErrorMessages):
+            if declared is not None:
+                cls._declared_error_messages = declared
+
+            cls.error_messages = Field.__dict__["error_messages"]
+
+        # Every class gets its own merged messages when it is defined so a
+        # subclass never sees its parent's
+        cls._class_error_messages = cls.merge_error_messages()
+
+    @classmethod
+    def merge_error_messages(cls):
+        """Merge the error messages declared by every class in the MRO"""
+
+        messages = dict()
+
+        for klass in reversed(cls.__mro__):
+            if "_declared_error_messages" in klass.__dict__:
+                klass_messages = klass.__dict__["_declared_error_messages"]
+            else:
+                klass_messages = klass.__dict__.get("error_messages")
+
+            if isinstance(klass_messages, dict):
+                messages.update(klass_messages)
+
+        return messages
+
+    @classmethod
+    def get_class_error_messages(cls):
+        """Error messages shared by instances without overrides"""
+
+        return cls._class_error_messages
 
     def __new__(cls, *args, **kwargs):
         instance = super(Field, cls).__new__(cls)
@@ -44,10 +311,10 @@ class Field(object):
         validators=None,
         error_messages=None,
         initial=None,
+        trusted=False,
     ):
         # Keep track of field declaration order
-        self._creation_counter = Field._creation_counter
-        Field._creation_counter += 1
+        self._creation_counter = next(_field_counter)
 
         if required is None:
             required = not read_only
@@ -70,37 +337,81 @@ class Field(object):
         self.write_only = write_only
         self.validators = validators
         self.initial = initial
+        self.trusted = trusted
+        self._trusted = trusted
 
-        messages = dict()
-
-        for cls in reversed(self.__class__.__mro__):
-            messages.update(getattr(cls, "error_messages", dict()))
-
+        # Layer overrides over the class's messages rather than merging
         if error_messages is not None:
-            messages.update(error_messages)
-
-        self.error_messages = messages
+            self.error_messages = ChainMap(
+                dict(error_messages), self.get_class_error_messages()
+            )
 
         self.field_name = None
         self.parent = None
 
-        self._context = {}
-
     def bind(self, parent, field_name=None):
         self.parent = parent
 
+        # Resolve the root once and share it with the fields below
+        if parent is None:
+            root = self
+        elif isinstance(parent, Field):
+            root = parent.root
+        else:
+            root = parent
+
+            while getattr(root, "parent", None) is not None:
+                root = root.parent
+
+        self.set_root(root)
+
         if self.field_name is None:
             self.field_name = field_name
 
         if self.source is None:
             self.source = field_name
 
+    def get_error_message(self, key):
+        # Doesn't give the instance its own messages (see ErrorMessages)
+        try:
+            messages = self._error_messages
+        except AttributeError:
+            messages = type(self).get_class_error_messages()
+
+        return messages[key]
+
     def fail(self, key):
-        raise ValidationError(self.error_messages[key])
+        raise ValidationError([self.get_error_message(key)], normalised=True)
+
+    def get_children(self):
+        """Fields bound to this field"""
+
+        return ()
+
+    def set_root(self, root):
+        self._root = root
+
+        # Trust is inherited from the fields above, like the root
+        self._trusted = self.trusted or getattr(self.parent, "_trusted", False)
+
+        for child in self.get_children():
+            child.set_root(root)
 
     @property
     def context(self):
-        return self.root._context
+        root = self.root
+
+        # Context for the current call (see using_context)
+        call_context = _call_context.get()
+
+        if call_context is not None and call_context[0] is root:
+            return call_context[1]
+
+        try:
+            return root._context
+        except AttributeError:
+            root._context = {}
+            return root._context
 
     def get_attribute(self, instance):
         try:
@@ -155,18 +466,53 @@ class Field(object):
 
         return data
 
+    def is_trusted(self):
+        """True if input of a native type can skip to_internal_value.
+
+        A field is trusted if it or a field it is bound to was created with
+        trusted=True.
+        """
+
+        return self._trusted
+
     def run_validation(self, data):
         data = self.validate_empty_values(data)
 
         if data is None:
             return data
 
-        value = self.to_internal_value(data)
+        if self._trusted and type(data) in self.native_types:
+            value = data
+        else:
+            value = self.to_internal_value(data)
+
         value = self.run_validators(value)
         value = self.validate(value)
 
         return value
 
+    def collect_validation(self, data, collector):
+        """Like run_validation but errors are added to collector.
+
+        Returns invalid if the value didn't validate.
+        """
+
+        try:
+            return self.run_validation(data)
+        except ValidationError as e:
+            collector.add(e.errors)
+            return invalid
+
+    def coerce_many(self, values):
+        """Convert a sequence of values with to_internal_value.
+
+        Raises ValidationError for the first value that is invalid.
+        Subclasses can override this to convert a whole column at once.
+        """
+
+        to_internal_value = self.to_internal_value
+        return [to_internal_value(x) for x in values]
+
     def run_validators(self, value):
         for validator in self.validators:
             if hasattr(validator, "set_context"):
@@ -184,12 +530,11 @@ class Field(object):
 
     @property
     def root(self):
-        root = self
-
-        while root.parent is not None:
-            root = root.parent
-
-        return root
+        # Unbound fields are their own root
+        try:
+            return self._root
+        except AttributeError:
+            return self
 
     def __deepcopy__(self, memo):
         args = copy.deepcopy(self._args)
@@ -198,10 +543,51 @@ class Field(object):
 
 
 class StringField(Field):
-    error_messages = {"invalid": "A valid string is required."}
+    __slots__ = (
+        "trim_whitespace",
+        "normalise_whitespace",
+        "case",
+        "min_length",
+        "max_length",
+        "intern",
+        "_interned",
+        "native_types",
+    )
+
+    error_messages = {
+        "invalid": "A valid string is required.",
+        "min_length": "Value is too short (min length is %d characters).",
+        "max_length": "Value is too long (max length is %d characters).",
+    }
+
+    # Number of distinct values kept by intern=True
+    intern_maxsize = 1024
 
     def __init__(self, **kwargs):
         self.trim_whitespace = kwargs.pop("trim_whitespace", True)
+
+        # Applied in one pass rather than as a chain of validators
+        self.normalise_whitespace = kwargs.pop("normalise_whitespace", False)
+        self.case = kwargs.pop("case", None)
+        self.min_length = kwargs.pop("min_length", None)
+        self.max_length = kwargs.pop("max_length", None)
+        assert self.case in (None, "upper", "lower")
+
+        # Trusted strings are still normalised
+        if self.normalise_whitespace or self.case:
+            self.native_types = ()
+        else:
+            self.native_types = (str,)
+
+        # Validated values are shared through a bounded dictionary, for
+        # columns with only a few distinct values (intern can be the size)
+        intern = kwargs.pop("intern", False)
+
+        if intern is True:
+            intern = self.intern_maxsize
+
+        self.intern = intern or None
+        self._interned = {} if intern else None
         super(StringField, self).__init__(**kwargs)
 
     def to_internal_value(self, data):
@@ -213,6 +599,51 @@ class StringField(Field):
         if self.trim_whitespace:
             value = value.strip()
 
+        normalise_whitespace = self.normalise_whitespace
+        case = self.case
+
+        if not (normalise_whitespace or case):
+            return value
+
+        # Clean ASCII strings are checked without allocating new strings
+        is_ascii = value.isascii()
+
+        if normalise_whitespace and not (
+            is_ascii and value.isprintable() and "  " not in value
+        ):
+            value = _whitespace_regex.sub(" ", value)
+
+        if case == "upper":
+            if not (is_ascii and value.isupper()):
+                value = value.upper()
+        elif case == "lower":
+            if not (is_ascii and value.islower()):
+                value = value.lower()
+
+        return value
+
+    def validate(self, value):
+        min_length = self.min_length
+        max_length = self.max_length
+
+        if min_length is not None and len(value) < min_length:
+            raise ValidationError(
+                [self.get_error_message("min_length") % min_length], normalised=True
+            )
+
+        if max_length is not None and len(value) > max_length:
+            raise ValidationError(
+                [self.get_error_message("max_length") % max_length], normalised=True
+            )
+
+        interned = self._interned
+
+        if interned is not None and type(value) is str:
+            if len(interned) < self.intern:
+                value = interned.setdefault(value, value)
+            else:
+                value = interned.get(value, value)
+
         return value
 
     def to_representation(self, value):
@@ -220,8 +651,12 @@ class StringField(Field):
 
 
 class BooleanField(Field):
+    __slots__ = ()
+
     error_messages = {"invalid": "A valid boolean is required."}
 
+    native_types = (bool,)
+
     TRUE_VALUES = {"t", "true", "y", "yes", "1", 1, True}
     FALSE_VALUES = {"f", "false", "n", "no", "0", 0, False}
 
@@ -245,31 +680,90 @@ class BooleanField(Field):
 
 
 class IntegerField(Field):
+    __slots__ = ()
+
     error_messages = {"invalid": "A valid integer is required."}
 
+    native_types = (int,)
+
     def to_internal_value(self, data):
-        if isinstance(data, str):
-            data = data.strip()
+        # Dispatch on the exact type so each value is only parsed once
+        data_type = type(data)
+
+        if data_type is int:
+            return data
+        elif data_type is str:
+            # int strips whitespace itself
+            try:
+                return int(data)
+            except ValueError:
+                self.fail("invalid")
+        elif data_type is float:
+            # No fractions, nan or infinity
+            if not data.is_integer():
+                self.fail("invalid")
 
+            return int(data)
+        elif data_type is Decimal:
+            if not data.is_finite() or data != data.to_integral_value():
+                self.fail("invalid")
+
+            return int(data)
+        elif data_type is bool:
+            return int(data)
+
+        # Anything else (e.g. subclasses of the above)
         try:
             value = int(data)
-            value_f = float(data)
 
-            # No floats
-            if value != value_f:
+            if value != data and value != float(data):
                 self.fail("invalid")
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             self.fail("invalid")
 
         return value
 
+    def coerce_many(self, values):
+        # The inline conversion would skip a subclass's own checks
+        if overrides(self, IntegerField, "to_internal_value"):
+            return super(IntegerField, self).coerce_many(values)
+
+        to_internal_value = self.to_internal_value
+
+        try:
+            return [
+                x
+                if type(x) is int
+                else int(x)
+                if type(x) is str
+                else to_internal_value(x)
+                for x in values
+            ]
+        except ValueError:
+            self.fail("invalid")
+
     def to_representation(self, value):
         return int(value)
 
 
 class FloatField(Field):
+    __slots__ = ()
+
     error_messages = {"invalid": "A valid number is required."}
 
+    native_types = (float,)
+
+    def coerce_many(self, values):
+        # The inline conversion would skip a subclass's own checks
+        if overrides(self, FloatField, "to_internal_value"):
+            return super(FloatField, self).coerce_many(values)
+
+        # float strips whitespace itself
+        try:
+            return [x if type(x) is float else float(x) for x in values]
+        except (ValueError, TypeError):
+            self.fail("invalid")
+
     def to_internal_value(self, data):
         if isinstance(data, str):
             data = data.strip()
@@ -286,11 +780,15 @@ class FloatField(Field):
 
 
 class DateField(Field):
+    __slots__ = ()
+
     error_messages = {
         "invalid": "Invalid date format.",
         "datetime": "Expected a date but got a datetime.",
     }
 
+    native_types = (date,)
+
     def parse(self, data):
         return parse_datetime(data).date()
 
@@ -319,11 +817,15 @@ class DateField(Field):
 
 
 class DateTimeField(Field):
+    __slots__ = ()
+
     error_messages = {
         "invalid": "Invalid date format.",
         "date": "Expected a datetime but got a date.",
     }
 
+    native_types = (datetime,)
+
     def parse(self, data):
         return parse_datetime(data)
 
@@ -352,12 +854,13 @@ class DateTimeField(Field):
 
 
 class ListField(Field):
-    child = None
+    # Subclasses can declare a child as a class attribute
+    __slots__ = ("child", "_coerce_items")
 
     error_messages = {"not_a_list": "Expected a list."}
 
     def __init__(self, *args, **kwargs):
-        self.child = kwargs.pop("child", copy.deepcopy(self.child))
+        self.child = kwargs.pop("child", copy.deepcopy(getattr(self, "child", None)))
         assert self.child is not None
 
         kwargs.setdefault("default", list)
@@ -366,25 +869,53 @@ class ListField(Field):
 
         self.child.bind(self)
 
+        # Lists of simple values are converted in one go (see coerce_items)
+        self._coerce_items = can_coerce_many(self.child)
+
+    def get_children(self):
+        return (self.child,)
+
     def to_internal_value(self, data):
         if not isinstance(data, list):
             self.fail("not_a_list")
 
-        values = []
-        errors = {}
+        collector = ErrorCollector()
+        values = self.collect_items(data, collector)
+        collector.raise_errors()
 
-        for i, x in enumerate(data):
-            try:
-                value = self.child.run_validation(x)
-            except ValidationError as e:
-                errors[i] = e.errors
-            else:
-                values.append(value)
+        return values
 
-        if errors:
-            raise ValidationError(errors)
+    def collect_items(self, data, collector):
+        if self._coerce_items:
+            values = coerce_items(self.child, data)
 
-        return values
+            if values is not invalid:
+                if not collector.path:
+                    collector.processed = len(data)
+
+                return values
+
+        # Validate each item to find which are invalid
+        return collect_items(self.child, data, collector)
+
+    def collect_validation(self, data, collector):
+        # Subclass changes how values are validated
+        if overrides(self, ListField, "run_validation", "to_internal_value"):
+            return super(ListField, self).collect_validation(data, collector)
+
+        return collect_container(
+            self,
+            data,
+            collector,
+            list,
+            "not_a_list",
+            self.collect_items,
+            self.finish_validation,
+        )
+
+    def finish_validation(self, values):
+        values = self.run_validators(values)
+        return self.validate(values)
 
     def to_representation(self, values):
         data = []
@@ -399,12 +930,13 @@ class ListField(Field):
 
 
 class CommaSeparatedField(Field):
-    child = None
+    # Subclasses can declare a child as a class attribute
+    __slots__ = ("child", "_coerce_items")
 
     error_messages = {"invalid": "A valid string is required."}
 
     def __init__(self, **kwargs):
-        self.child = kwargs.pop("child", copy.deepcopy(self.child))
+        self.child = kwargs.pop("child", copy.deepcopy(getattr(self, "child", None)))
         assert self.child is not None
 
         kwargs.setdefault("default", list)
@@ -413,6 +945,12 @@ class CommaSeparatedField(Field):
 
         self.child.bind(self)
 
+        # Lists of simple values are converted in one go (see coerce_items)
+        self._coerce_items = can_coerce_many(self.child)
+
+    def get_children(self):
+        return (self.child,)
+
     def to_internal_value(self, data):
         if isinstance(data, dict) or isinstance(data, bool):
             self.fail("invalid")
@@ -427,6 +965,12 @@ class CommaSeparatedField(Field):
             else:
                 parts = data.split(",")
 
+        if self._coerce_items:
+            values = coerce_items(self.child, parts)
+
+            if values is not invalid:
+                return values
+
         values = []
 
         for part in parts:
@@ -450,6 +994,8 @@ class CommaSeparatedField(Field):
 
 
 class UUIDField(Field):
+    __slots__ = ()
+
     error_messages = {"invalid": "A valid UUID is required."}
 
     def to_internal_value(self, data):
@@ -470,11 +1016,14 @@ class UUIDField(Field):
 
 
 class EnumField(Field):
+    __slots__ = ("enum", "native_types")
+
     error_messages = {"invalid": "Not a valid value."}
 
     def __init__(self, enum, **kwargs):
         super(EnumField, self).__init__(**kwargs)
         self.enum = enum
+        self.native_types = (enum,)
 
     def to_internal_value(self, data):
         try:
@@ -494,6 +1043,8 @@ class EnumField(Field):
 
 
 class LookupField(Field):
+    __slots__ = ("key_field", "value_field", "items", "key_name", "value_name")
+
     error_messages = {"invalid": "Not a valid value."}
 
     def __init__(
@@ -515,6 +1066,9 @@ class LookupField(Field):
         self.key_name = key_name
         self.value_name = value_name
 
+    def get_children(self):
+        return (self.key_field, self.value_field)
+
     def to_internal_value(self, data):
         if isinstance(data, dict):
             data = data.get(self.key_name, empty)
@@ -546,18 +1100,24 @@ class LookupField(Field):
 
 
 class StringLookupField(LookupField):
+    __slots__ = ()
+
     def __init__(self, items, **kwargs):
         kwargs["key_field"] = StringField()
         super(StringLookupField, self).__init__(items, **kwargs)
 
 
 class IntegerLookupField(LookupField):
+    __slots__ = ()
+
     def __init__(self, items, **kwargs):
         kwargs["key_field"] = IntegerField()
         super(IntegerLookupField, self).__init__(items, **kwargs)
 
 
 class EnumLookupField(LookupField):
+    __slots__ = ()
+
     def __init__(self, enum, items, **kwargs):
         kwargs["key_field"] = EnumField(enum)
         super(EnumLookupField, self).__init__(items, **kwargs)
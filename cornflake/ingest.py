@@ -0,0 +1,433 @@
+import collections
+import csv
+import importlib
+import itertools
+import json
+import mmap
+import multiprocessing
+import os
+import time
+
+from cornflake.exceptions import ValidationError
+from cornflake.serializers import ValidationResult
+
+
+class IngestResult(object):
+    """Counts of the rows ingested so far"""
+
+    def __init__(self):
+        self.rows = 0
+        self.valid = 0
+        self.invalid = 0
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        if not self.elapsed:
+            return 0.0
+
+        return self.rows / self.elapsed
+
+    def __repr__(self):
+        return "IngestResult(rows=%d, valid=%d, invalid=%d, %.0f rows/s)" % (
+            self.rows,
+            self.valid,
+            self.invalid,
+            self.rows_per_second,
+        )
+
+
+def get_column_mapping(fieldnames, serializer_class, columns=None):
+    """Map CSV columns to the serializer's fields.
+
+    columns maps column names to field names. Columns not in columns are
+    mapped to the field of the same name, and ignored if there isn't one.
+    """
+
+    if columns is None:
+        columns = {}
+
+    # The bound fields include those built at runtime (e.g. from a model)
+    fields = serializer_class.get_shared().fields
+    mapping = []
+
+    for column in fieldnames:
+        field_name = columns.get(column, column)
+        field = fields.get(field_name)
+
+        if field is not None and not field.read_only:
+            mapping.append((column, field_name))
+
+    return mapping
+
+
+def read_csv(fp, serializer_class, columns=None, empty_as_none=True, **kwargs):
+    """Yields (line number, data) for each row of a CSV file.
+
+    The line number is that of the row's last line in the file. The data
+    is keyed by field name (see get_column_mapping). CSV has no nulls so
+    by default empty values are read as None. Other keyword arguments are
+    passed to csv.DictReader.
+    """
+
+    reader = csv.DictReader(fp, **kwargs)
+    mapping = get_column_mapping(reader.fieldnames or [], serializer_class, columns)
+
+    for row in reader:
+        data = {}
+
+        for column, field_name in mapping:
+            value = row[column]
+
+            if empty_as_none and value == "":
+                value = None
+
+            data[field_name] = value
+
+        yield reader.line_num, data
+
+
+def validate_batch(serializer_class, batch, context=None):
+    """Validate a batch of (line number, data) rows.
+
+    Returns a list of validated values and a list of (line number, data,
+    errors) for the invalid rows. This is a top-level function so it can
+    be run in another process.
+    """
+
+    values = []
+    errors = []
+
+    for line_num, data in batch:
+        result = serializer_class.check(data, context=context)
+
+        if result.errors:
+            errors.append((line_num, data, result.errors))
+        else:
+            values.append(result.validated_data)
+
+    return values, errors
+
+
+def _validate_batch_in_process(serializer_class, batch, context):
+    values, errors = validate_batch(serializer_class, batch, context)
+
+    # Row classes are built at runtime so can't be pickled
+    values = [x if isinstance(x, dict) else dict(x) for x in values]
+
+    return values, errors
+
+
+def _batches(rows, batch_size):
+    rows = iter(rows)
+
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+
+        if not batch:
+            return
+
+        yield batch
+
+
+def ingest(
+    fp,
+    serializer_class,
+    valid_sink,
+    error_sink,
+    columns=None,
+    batch_size=1000,
+    processes=None,
+    progress=None,
+    context=None,
+    **kwargs,
+):
+    """Validate a CSV file with serializer_class in batches.
+
+    The validated values of each batch are passed to valid_sink and the
+    invalid rows to error_sink (as (line number, data, errors)). Only a
+    few batches are held in memory at once.
+
+    With processes the batches are validated by a pool of that many
+    processes, so serializer_class must be importable by them. progress
+    is called with the IngestResult after each batch.
+    """
+
+    result = IngestResult()
+    rows = read_csv(fp, serializer_class, columns=columns, **kwargs)
+    batches = _batches(rows, batch_size)
+
+    def handle(batch_values, batch_errors):
+        result.valid += len(batch_values)
+        result.invalid += len(batch_errors)
+        result.rows = result.valid + result.invalid
+        result.elapsed = time.monotonic() - result.started
+
+        if batch_values:
+            valid_sink(batch_values)
+
+        if batch_errors:
+            error_sink(batch_errors)
+
+        if progress is not None:
+            progress(result)
+
+    if processes is None:
+        for batch in batches:
+            handle(*validate_batch(serializer_class, batch, context))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            # Bound the batches in flight so memory stays constant
+            pending = collections.deque()
+
+            for batch in batches:
+                pending.append(
+                    pool.apply_async(
+                        _validate_batch_in_process, (serializer_class, batch, context)
+                    )
+                )
+
+                if len(pending) >= 2 * processes:
+                    handle(*pending.popleft().get())
+
+            while pending:
+                handle(*pending.popleft().get())
+
+    result.elapsed = time.monotonic() - result.started
+
+    return result
+
+
+def format_errors(errors):
+    """Format errors on one line, e.g. for a reject file"""
+
+    return "; ".join(
+        "%s: %s" % (".".join(str(x) for x in path), message) if path else message
+        for path, message in ValidationError(errors, normalised=True).iter_flat()
+    )
+
+
+class CSVErrorWriter(object):
+    """An error sink that writes invalid rows to a CSV reject file.
+
+    Each row is written with its line number in the source file and its
+    errors (see format_errors).
+    """
+
+    def __init__(self, fp, fieldnames, **kwargs):
+        fieldnames = ["line"] + list(fieldnames) + ["errors"]
+        self.writer = csv.DictWriter(fp, fieldnames, extrasaction="ignore", **kwargs)
+        self.writer.writeheader()
+
+    def __call__(self, errors):
+        for line_num, data, row_errors in errors:
+            row = dict(data)
+            row["line"] = line_num
+            row["errors"] = format_errors(row_errors)
+            self.writer.writerow(row)
+
+
+# Tried in order by get_decoder("auto")
+_fast_decoders = ["orjson", "ujson"]
+
+
+def get_decoder(decoder=None):
+    """Returns a function that decodes one JSON document.
+
+    decoder can be a function, the name of a module with a loads function
+    ("json", "orjson" or "ujson") or "auto" to use the fastest of these
+    that is installed. Defaults to the standard library's json.
+    """
+
+    if callable(decoder):
+        return decoder
+
+    if decoder is None:
+        decoder = "json"
+
+    if decoder == "auto":
+        for name in _fast_decoders:
+            try:
+                return importlib.import_module(name).loads
+            except ImportError:
+                pass
+
+        decoder = "json"
+
+    if decoder == "json":
+        return json.loads
+
+    return importlib.import_module(decoder).loads
+
+
+def validate_jsonl(path_or_fp, serializer_class, decoder=None, context=None):
+    """Yields (line number, ValidationResult) for each line of a JSON Lines file.
+
+    Lines are decoded one at a time (see get_decoder) and validated with
+    serializer_class.check, so memory use doesn't grow with the file. Blank
+    lines are skipped and lines that aren't valid JSON are invalid.
+    """
+
+    loads = get_decoder(decoder)
+
+    if isinstance(path_or_fp, (str, bytes, os.PathLike)):
+        with open(path_or_fp, "rb") as fp:
+            for x in _validate_lines(fp, serializer_class, loads, context):
+                yield x
+    else:
+        for x in _validate_lines(path_or_fp, serializer_class, loads, context):
+            yield x
+
+
+def _validate_lines(lines, serializer_class, loads, context):
+    for line_num, line in enumerate(lines, 1):
+        result = _validate_line(line, serializer_class, loads, context)
+
+        if result is not None:
+            yield line_num, result
+
+
+def _validate_line(line, serializer_class, loads, context):
+    # Returns None for blank lines
+    if not line.strip():
+        return None
+
+    try:
+        data = loads(line)
+    except ValueError:
+        return ValidationResult({}, {"_": ["Invalid JSON."]})
+
+    return serializer_class.check(data, context=context)
+
+
+def find_chunks(path, chunk_size=64 * 1024 * 1024):
+    """Split a file into (start, end) byte ranges of whole lines.
+
+    Each range is about chunk_size bytes and ends just after a newline
+    (or at the end of the file).
+    """
+
+    assert chunk_size > 0
+
+    chunks = []
+
+    with open(path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+
+        if not size:
+            return chunks
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+
+            while start < size:
+                end = mm.find(b"\n", min(start + chunk_size, size) - 1)
+
+                if end == -1:
+                    end = size
+                else:
+                    end += 1
+
+                chunks.append((start, end))
+                start = end
+
+    return chunks
+
+
+def validate_jsonl_range(
+    path, start, end, serializer_class, decoder=None, context=None
+):
+    """Validate the lines of a JSON Lines file between two byte offsets.
+
+    Returns the number of lines, the number of valid lines and a list of
+    (line number, errors) with line numbers relative to the range. This is
+    a top-level function so it can be run in another process.
+    """
+
+    loads = get_decoder(decoder)
+    line_num = 0
+    valid = 0
+    errors = []
+
+    with open(path, "rb") as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.seek(start)
+
+            # Ranges end on a line boundary so lines never cross the end
+            while mm.tell() < end:
+                line = mm.readline()
+                line_num += 1
+                result = _validate_line(line, serializer_class, loads, context)
+
+                if result is None:
+                    continue
+                elif result.errors:
+                    errors.append((line_num, result.errors))
+                else:
+                    valid += 1
+
+    return line_num, valid, errors
+
+
+def _validate_jsonl_range(args):
+    return validate_jsonl_range(*args)
+
+
+def validate_jsonl_parallel(
+    path,
+    serializer_class,
+    error_sink=None,
+    processes=None,
+    chunk_size=64 * 1024 * 1024,
+    decoder=None,
+    context=None,
+    progress=None,
+):
+    """Validate a JSON Lines file with a pool of processes.
+
+    The file is split into chunks of whole lines (see find_chunks) and
+    each process is only sent a chunk's byte offsets, which it reads from
+    its own memory map of the file. The invalid lines of each chunk are
+    passed to error_sink as (line number, errors). Returns an IngestResult.
+
+    processes defaults to the number of CPUs, and with 1 the chunks are
+    validated in this process.
+    """
+
+    result = IngestResult()
+    chunks = find_chunks(path, chunk_size)
+    tasks = [
+        (path, start, end, serializer_class, decoder, context) for start, end in chunks
+    ]
+
+    def handle(line_offset, chunk_result):
+        lines, valid, errors = chunk_result
+
+        result.valid += valid
+        result.invalid += len(errors)
+        result.rows = result.valid + result.invalid
+        result.elapsed = time.monotonic() - result.started
+
+        if errors and error_sink is not None:
+            error_sink([(line_offset + x, y) for x, y in errors])
+
+        if progress is not None:
+            progress(result)
+
+        return line_offset + lines
+
+    line_offset = 0
+
+    if processes == 1:
+        for task in tasks:
+            line_offset = handle(line_offset, validate_jsonl_range(*task))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            # Results come back in order so line numbers can be made absolute
+            for chunk_result in pool.imap(_validate_jsonl_range, tasks):
+                line_offset = handle(line_offset, chunk_result)
+
+    result.elapsed = time.monotonic() - result.started
+
+    return result
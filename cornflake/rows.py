@@ -0,0 +1,175 @@
+from collections.abc import Mapping, MutableMapping
+
+from cornflake.fields import empty
+
+
+class SlotsRow(MutableMapping):
+    """Mapping that stores its values in slots.
+
+    Subclasses are generated per shape by row_class. Values are stored in
+    slots named by position so field names can't clash with the mapping
+    methods.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+    _index: dict = {}
+    _attrs = ()
+
+    def __init__(self, values=()):
+        for key, value in dict(values).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._attrs[self._index[key]])
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self, self._attrs[self._index[key]], value)
+
+    def __delitem__(self, key):
+        try:
+            delattr(self, self._attrs[self._index[key]])
+        except AttributeError:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key, attr in zip(self._fields, self._attrs):
+            if hasattr(self, attr):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, dict(self.items()))
+
+
+class TupleRow(tuple):
+    """Read-only mapping that stores its values in a tuple.
+
+    Subclasses are generated per shape by row_class. Missing values are
+    stored as empty. Integer indexes access the tuple directly.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+    _index: dict = {}
+
+    def __new__(cls, values=()):
+        values = dict(values)
+
+        for key in values:
+            if key not in cls._index:
+                raise KeyError(key)
+
+        return tuple.__new__(cls, [values.get(key, empty) for key in cls._fields])
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, slice)):
+            return tuple.__getitem__(self, key)
+
+        try:
+            value = tuple.__getitem__(self, self._index[key])
+        except KeyError:
+            raise KeyError(key)
+
+        if value is empty:
+            raise KeyError(key)
+
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def keys(self):
+        return [
+            key
+            for key, value in zip(self._fields, tuple.__iter__(self))
+            if value is not empty
+        ]
+
+    def values(self):
+        return [value for value in tuple.__iter__(self) if value is not empty]
+
+    def items(self):
+        return [
+            (key, value)
+            for key, value in zip(self._fields, tuple.__iter__(self))
+            if value is not empty
+        ]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, dict(self.items()))
+
+
+# Rows are read like any other mapping, e.g. by Field.get_attribute
+Mapping.register(TupleRow)
+
+ROW_TYPES = {"slots": SlotsRow, "tuple": TupleRow}
+
+# (name, row type, keys) -> row class
+_row_classes: dict = {}
+
+
+def row_class(name, keys, row_type="slots"):
+    """Get a row class with the given keys.
+
+    Classes are cached so every serializer with the same shape shares one.
+    """
+
+    keys = tuple(keys)
+    cache_key = (name, row_type, keys)
+
+    try:
+        return _row_classes[cache_key]
+    except KeyError:
+        pass
+
+    base = ROW_TYPES[row_type]
+    attrs = {
+        "__slots__": (),
+        "_fields": keys,
+        "_index": {key: i for i, key in enumerate(keys)},
+    }
+
+    if base is SlotsRow:
+        attrs["_attrs"] = attrs["__slots__"] = tuple(
+            "_%d" % i for i in range(len(keys))
+        )
+
+    cls = type(name + "Row", (base,), attrs)
+
+    return _row_classes.setdefault(cache_key, cls)
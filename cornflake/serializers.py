@@ -1,14 +1,138 @@
 import copy
+import functools
+import threading
+from collections.abc import Mapping, MutableMapping
 from collections import OrderedDict
 
 import six
 
-from cornflake.fields import Field
-from cornflake.exceptions import ValidationError, SkipField
+from cornflake.fields import (
+    Field,
+    collect_container,
+    collect_items,
+    empty,
+    invalid,
+    overrides,
+    using_context,
+)
+from cornflake.exceptions import ErrorCollector, ValidationError, SkipField
+from cornflake import rows
+
+
+def parse_fieldset(paths):
+    """Parse a list of dotted field paths into a nested dict.
+
+    Fields that were named in full map to None, fields with named children
+    map to a dict of those children. Already parsed fieldsets are returned
+    unchanged.
+    """
+
+    if paths is None or isinstance(paths, dict):
+        return paths
+
+    fieldset = {}
+
+    for path in paths:
+        names = path.split(".")
+        node = fieldset
+
+        for name in names[:-1]:
+            node = node.setdefault(name, {})
+
+            # Parent already included/excluded in full
+            if node is None:
+                break
+        else:
+            node[names[-1]] = None
+
+    return fieldset
+
+
+class ValidationResult(object):
+    """Outcome of a call to BaseSerializer.check"""
+
+    def __init__(self, validated_data, errors, truncated=False, processed=None):
+        self.validated_data = validated_data
+        self.errors = errors
+        self.truncated = truncated
+        self.processed = processed
+
+    @property
+    def is_valid(self):
+        return not bool(self.errors)
+
+    def __bool__(self):
+        return self.is_valid
+
+    __nonzero__ = __bool__
+
+    def raise_for_errors(self):
+        if self.errors:
+            raise ValidationError(self.errors, normalised=True)
+
+
+def build_field_tree(field):
+    """Build any lazily created fields below field"""
+
+    if isinstance(field, Serializer):
+        # Accessing fields builds and binds them
+        _ = field.fields
+
+    for child in field.get_children():
+        build_field_tree(child)
+
+
+def get_collector(max_errors=None, fail_fast=False, collector=None):
+    """The ErrorCollector for a validation stopping after max_errors errors.
+
+    With fail_fast that is the first error. collector is used if given.
+    """
+
+    if fail_fast:
+        max_errors = 1
+
+    if collector is None:
+        collector = ErrorCollector(max_errors=max_errors)
+    elif max_errors is not None:
+        collector.max_errors = max_errors
+
+    return collector
+
+
+def bounded_validation(run_validation):
+    """Add the max_errors and fail_fast arguments to run_validation.
+
+    With either, data is validated by run_bounded_validation and the
+    collected errors are raised.
+    """
+
+    @functools.wraps(run_validation)
+    def wrapper(self, data, max_errors=None, fail_fast=False):
+        if max_errors is None and not fail_fast:
+            return run_validation(self, data)
+
+        value, collector = self.run_bounded_validation(data, max_errors, fail_fast)
+        collector.raise_errors()
+
+        return value
+
+    return wrapper
+
+
+# Guards creation of the shared serializers
+_shared_lock = threading.Lock()
 
 
 class BaseSerializer(Field):
-    def __init__(self, instance=None, data=None, partial=False, **kwargs):
+    def __init__(
+        self,
+        instance=None,
+        data=None,
+        partial=False,
+        only=None,
+        exclude=None,
+        **kwargs,
+    ):
         meta = getattr(self, "Meta", None)
 
         if meta is not None:
@@ -17,6 +141,9 @@ class BaseSerializer(Field):
             if default_validators is not None and kwargs.get("validators") is None:
                 kwargs["validators"] = default_validators
 
+            if getattr(meta, "trusted", False):
+                kwargs.setdefault("trusted", True)
+
         context = kwargs.pop("context", None)
 
         super(BaseSerializer, self).__init__(**kwargs)
@@ -34,43 +161,203 @@ class BaseSerializer(Field):
         self.errors = {}
         self.validated_data = {}
 
+        # Set by is_valid (see ErrorCollector)
+        self.truncated = False
+        self.processed = None
+
         # Instance is required for partial updates
         assert not (partial and instance is None)
 
         self.partial = partial
 
+        self.only = parse_fieldset(only)
+        self.exclude = parse_fieldset(exclude)
+
     def get_partial(self):
         raise NotImplementedError
 
-    def is_valid(self, raise_exception=False):
-        if self.partial:
-            data = self.get_partial()
-        else:
-            data = self.initial_data
+    @classmethod
+    def get_shared(cls):
+        """Serializer shared by every call to check.
+
+        Built (with no arguments) on first use, along with its whole field
+        tree, and never modified afterwards.
+        """
+
+        # Look in __dict__ so a subclass doesn't use its parent's serializer
+        try:
+            return cls.__dict__["_shared_serializer"]
+        except KeyError:
+            pass
+
+        with _shared_lock:
+            if "_shared_serializer" not in cls.__dict__:
+                serializer = cls()
+                build_field_tree(serializer)
+                cls._shared_serializer = serializer
+
+        return cls.__dict__["_shared_serializer"]
+
+    @classmethod
+    def check(
+        cls,
+        data,
+        context=None,
+        instance=None,
+        partial=False,
+        max_errors=None,
+        fail_fast=False,
+        collector=None,
+    ):
+        """Validate data without constructing a serializer.
+
+        Safe to call from many threads at once as all of the state of the
+        call is kept in the returned ValidationResult. instance is only used
+        by (and required for) partial updates.
+        """
+
+        assert partial == (instance is not None)
+
+        serializer = cls.get_shared()
+
+        if context is None:
+            context = {}
+
+        with using_context(serializer, context):
+            if partial:
+                try:
+                    value = serializer.run_partial_validation(data, instance)
+                except ValidationError as e:
+                    return ValidationResult({}, e.errors)
+
+                return ValidationResult(value, {})
+
+            value, collector = serializer.run_bounded_validation(
+                data, max_errors=max_errors, fail_fast=fail_fast, collector=collector
+            )
+
+        if collector.count:
+            value = {}
 
+        return ValidationResult(
+            value,
+            collector.errors,
+            truncated=collector.truncated,
+            processed=collector.processed,
+        )
+
+    def run_partial_validation(self, data, instance):
+        """Validate a partial update of instance.
+
+        By default the partial data is merged into a full representation of
+        the instance (see get_partial) and validated in full.
+        """
+
+        return self.run_validation(self.get_partial())
+
+    def run_serializer_validation(self, value):
         try:
-            self.validated_data = self.run_validation(data)
+            value = self.run_validators(value)
+            value = self.validate(value)
         except ValidationError as e:
+            if isinstance(e.errors, dict):
+                raise
+            else:
+                raise ValidationError({"_": e.errors}, normalised=True)
+
+        return value
+
+    def run_bounded_validation(
+        self, data, max_errors=None, fail_fast=False, collector=None
+    ):
+        """Validate data, stopping after max_errors errors.
+
+        With fail_fast validation stops at the first error. Returns the
+        value and the ErrorCollector the errors were collected in, which
+        may be given (e.g. an ErrorSummary).
+        """
+
+        collector = get_collector(max_errors, fail_fast, collector)
+
+        # Errors are collected rather than raised and re-raised
+        value = self.collect_validation(data, collector)
+
+        return value, collector
+
+    def is_valid(
+        self, raise_exception=False, max_errors=None, fail_fast=False, collector=None
+    ):
+        if self.partial:
+            if collector is None:
+                collector = ErrorCollector()
+
+            try:
+                value = self.run_partial_validation(self.initial_data, self.instance)
+            except ValidationError as e:
+                collector.add(e.errors)
+        else:
+            value, collector = self.run_bounded_validation(
+                self.initial_data,
+                max_errors=max_errors,
+                fail_fast=fail_fast,
+                collector=collector,
+            )
+
+        self.truncated = collector.truncated
+        self.processed = collector.processed
+
+        if collector.count:
             self.validated_data = {}
-            self.errors = e.errors
+            self.errors = collector.errors
         else:
+            self.validated_data = value
             self.errors = {}
 
         if self.errors and raise_exception:
-            raise ValidationError(self.errors)
+            raise ValidationError(self.errors, normalised=True)
 
         return not bool(self.errors)
 
+    @property
+    def instance(self):
+        return self._instance
+
+    @instance.setter
+    def instance(self, value):
+        self._instance = value
+        self._data = empty
+
+    @property
+    def validated_data(self):
+        return self._validated_data
+
+    @validated_data.setter
+    def validated_data(self, value):
+        self._validated_data = value
+        self._data = empty
+
     @property
     def data(self):
+        # Cached until instance or validated_data changes. Callers get their
+        # own copy so they can't change the cached data
+        if self._data is not empty:
+            return copy.deepcopy(self._data)
+
         if self.instance is not None:
-            data = self.to_representation(self.instance)
+            value = self.instance
         elif self.validated_data:
-            data = self.to_representation(self.validated_data)
+            value = self.validated_data
         else:
-            data = self.to_representation(self.get_initial())
+            value = self.get_initial()
 
-        return data
+        if self.only is None and self.exclude is None:
+            data = self.to_representation(value)
+        else:
+            data = self.to_representation(value, only=self.only, exclude=self.exclude)
+
+        self._data = data
+
+        return copy.deepcopy(data)
 
     def create(self, validated_data):
         raise NotImplementedError
@@ -110,6 +397,66 @@ def _merge_fields(a, b):
     return fields
 
 
+def _get_value(instance, name):
+    if isinstance(instance, Mapping):
+        return instance.get(name)
+    else:
+        return getattr(instance, name, None)
+
+
+class PartialData(MutableMapping):
+    """Validated changes for a partial update.
+
+    Keys that weren't changed are read from the instance on access.
+    """
+
+    def __init__(self, serializer, instance, changes):
+        self.serializer = serializer
+        self.instance = instance
+        self.changes = changes
+        self._fields = None
+
+    @property
+    def fields(self):
+        if self._fields is None:
+            self._fields = {
+                field.source: field for field in self.serializer.writable_fields
+            }
+
+        return self._fields
+
+    def __getitem__(self, key):
+        try:
+            return self.changes[key]
+        except KeyError:
+            pass
+
+        field = self.fields[key]
+
+        try:
+            return field.get_attribute(self.instance)
+        except SkipField:
+            return None
+
+    def __setitem__(self, key, value):
+        self.changes[key] = value
+
+    def __delitem__(self, key):
+        del self.changes[key]
+
+    def __iter__(self):
+        keys = list(self.fields)
+
+        for key in self.changes:
+            if key not in self.fields:
+                keys.append(key)
+
+        return iter(keys)
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+
 class SerializerMetaclass(type):
     def __new__(cls, name, bases, attrs):
         attrs["_declared_fields"] = cls.get_fields(bases, attrs)
@@ -185,6 +532,10 @@ class Serializer(BaseSerializer):
     def __init__(self, *args, **kwargs):
         super(Serializer, self).__init__(*args, **kwargs)
         self._fields = None
+        self._row_class = None
+
+        # Keys rows have besides the writable fields (see get_row_class)
+        self.extra_row_keys = ()
 
     def get_initial(self):
         data = {}
@@ -216,6 +567,33 @@ class Serializer(BaseSerializer):
 
         return self._fields
 
+    def get_children(self):
+        # Fields that haven't been built yet will be bound to this serializer
+        if self._fields is None:
+            return ()
+
+        return self._fields.values()
+
+    def get_row_class(self):
+        """Compact class for validated rows, from Meta.row_type.
+
+        Meta.row_type can be "slots" or "tuple" (see cornflake.rows). By
+        default validated rows are dicts.
+        """
+
+        meta = getattr(self, "Meta", None)
+        row_type = getattr(meta, "row_type", None)
+
+        if row_type is None:
+            return None
+
+        if self._row_class is None:
+            keys = [field.source for field in self.writable_fields]
+            keys += [x for x in self.extra_row_keys if x not in keys]
+            self._row_class = rows.row_class(self.__class__.__name__, keys, row_type)
+
+        return self._row_class
+
     @property
     def writable_fields(self):
         return [field for field in self.fields.values() if not field.read_only]
@@ -224,6 +602,7 @@ class Serializer(BaseSerializer):
     def readable_fields(self):
         return [field for field in self.fields.values() if not field.write_only]
 
+    @bounded_validation
     def run_validation(self, data):
         data = self.validate_empty_values(data)
 
@@ -231,15 +610,38 @@ class Serializer(BaseSerializer):
             return data
 
         value = self.to_internal_value(data)
+        value = self.run_serializer_validation(value)
 
-        try:
-            value = self.run_validators(value)
-            value = self.validate(value)
-        except ValidationError as e:
-            if isinstance(e.errors, dict):
-                raise
-            else:
-                raise ValidationError({"_": e.errors})
+        row_class = self.get_row_class()
+
+        if row_class is not None:
+            value = row_class(value)
+
+        return value
+
+    def run_partial_validation(self, data, instance):
+        """Validate a partial update of instance.
+
+        Only the fields present in data are validated. Other fields are read
+        from the instance if the serializer's validators ask for them. The
+        validated changes are returned.
+        """
+
+        if not isinstance(data, dict):
+            self.fail("not_a_dict")
+
+        fields = [field for field in self.writable_fields if field.field_name in data]
+        value = self._to_internal_value(data, fields, partial_instance=instance)
+        value = PartialData(self, instance, value)
+        value = self.run_serializer_validation(value)
+
+        if isinstance(value, PartialData):
+            value = value.changes
+
+        row_class = self.get_row_class()
+
+        if row_class is not None:
+            value = row_class(value)
 
         return value
 
@@ -260,7 +662,7 @@ class Serializer(BaseSerializer):
 
                 value = validator(value)
         except ValidationError as e:
-            raise ValidationError({field.field_name: e.errors})
+            raise ValidationError({field.field_name: e.errors}, normalised=True)
 
         data[field.source] = value
 
@@ -275,7 +677,7 @@ class Serializer(BaseSerializer):
             if isinstance(e.errors, dict):
                 raise
             else:
-                raise ValidationError({"_": e.errors})
+                raise ValidationError({"_": e.errors}, normalised=True)
 
         return data
 
@@ -283,47 +685,237 @@ class Serializer(BaseSerializer):
         if not isinstance(data, dict):
             self.fail("not_a_dict")
 
-        errors = {}
-        pre_value = {}
+        return self._to_internal_value(data, self.writable_fields)
 
-        for field in self.writable_fields:
-            pre_value[field.source] = field.get_value(data)
+    def _to_internal_value(self, data, fields, value=None, partial_instance=None):
+        """Validate fields from data, storing the results in value.
 
-        pre_value = self.pre_validate(pre_value)
-        value = {}
+        For a partial update of partial_instance, pre_validate is given the
+        instance's values for the fields missing from data.
+        """
 
-        for field in self.writable_fields:
-            field_value = pre_value[field.source]
-            validate_method = getattr(self, "validate_" + field.field_name, None)
+        collector = ErrorCollector()
+        value = self._collect_internal_value(
+            data, fields, collector, value, partial_instance
+        )
+        collector.raise_errors()
 
-            try:
-                field_value = field.run_validation(field_value)
+        return value
 
-                if validate_method is not None:
-                    field_value = validate_method(field_value)
-            except ValidationError as e:
-                errors[field.field_name] = e.errors
+    def _collect_internal_value(
+        self, data, fields, collector, value=None, partial_instance=None
+    ):
+        # Only copy the input if pre_validate has been overridden
+        if type(self).pre_validate is Serializer.pre_validate:
+            pre_value = None
+        else:
+            pre_value = {}
+
+            for field in fields:
+                pre_value[field.source] = field.get_value(data)
+
+            if partial_instance is not None:
+                pre_value = PartialData(self, partial_instance, pre_value)
+
+            pre_value = self.pre_validate(pre_value)
+
+            # Fields that pre_validate set are validated too
+            if isinstance(pre_value, PartialData):
+                pre_value = pre_value.changes
+                fields = fields + [
+                    field
+                    for field in self.writable_fields
+                    if field.source in pre_value and field not in fields
+                ]
+
+        if value is None:
+            value = {}
+
+        path = collector.path
+
+        for field in fields:
+            if pre_value is None:
+                field_value = field.get_value(data)
             else:
+                field_value = pre_value[field.source]
+
+            path.append(field.field_name)
+            field_value = field.collect_validation(field_value, collector)
+
+            if field_value is not invalid:
+                validate_method = getattr(self, "validate_" + field.field_name, None)
+
+                if validate_method is not None:
+                    try:
+                        field_value = validate_method(field_value)
+                    except ValidationError as e:
+                        collector.add(e.errors)
+                        field_value = invalid
+
+            path.pop()
+
+            if field_value is not invalid:
                 value[field.source] = field_value
 
-        if errors:
-            raise ValidationError(errors)
+            if collector.full:
+                if field is not fields[-1]:
+                    collector.truncated = True
+
+                break
+
+        return value
+
+    def collect_validation(self, data, collector):
+        # Subclass changes how values are validated
+        if overrides(self, Serializer, "run_validation", "to_internal_value"):
+            return super(Serializer, self).collect_validation(data, collector)
+
+        return self._collect_validation(data, collector)
+
+    def _collect_validation(self, data, collector):
+        return collect_container(
+            self,
+            data,
+            collector,
+            dict,
+            "not_a_dict",
+            self._collect_fields,
+            self._finish_validation,
+        )
+
+    def _collect_fields(self, data, collector):
+        return self._collect_internal_value(data, self.writable_fields, collector)
+
+    def _finish_validation(self, value):
+        value = self.run_serializer_validation(value)
+        row_class = self.get_row_class()
+
+        if row_class is not None:
+            value = row_class(value)
 
         return value
 
-    def to_representation(self, instance):
+    @classmethod
+    def get_cache(cls):
+        """Representation cache from Meta.cache (disabled by default).
+
+        Without Meta.cache_version there is no staleness check, so an entry
+        is only replaced when save() on this serializer invalidates it. Rows
+        that can be changed elsewhere need a cache_version.
+        """
+
+        meta = getattr(cls, "Meta", None)
+        return getattr(meta, "cache", None)
+
+    @classmethod
+    def get_cache_key(cls, instance):
+        """Identity of an instance in the representation cache.
+
+        Uses the Meta.cache_key attribute (defaults to "id"). Instances
+        without an identity (e.g. unsaved rows) aren't cached.
+        """
+
+        meta = getattr(cls, "Meta", None)
+        pk = _get_value(instance, getattr(meta, "cache_key", "id"))
+
+        if pk is None:
+            return None
+
+        return (cls, pk)
+
+    @classmethod
+    def get_cache_version(cls, instance):
+        """Version of an instance, from the Meta.cache_version attribute.
+
+        A cached representation is only used if its version matches, so a
+        version column or updated_at timestamp invalidates stale entries.
+        """
+
+        meta = getattr(cls, "Meta", None)
+        version_name = getattr(meta, "cache_version", None)
+
+        if version_name is None:
+            return None
+
+        return _get_value(instance, version_name)
+
+    @classmethod
+    def invalidate_cache(cls, instance):
+        cache = cls.get_cache()
+
+        if cache is None:
+            return
+
+        key = cls.get_cache_key(instance)
+
+        if key is not None:
+            cache.delete(key)
+
+    def save(self, **kwargs):
+        instance = super(Serializer, self).save(**kwargs)
+        self.invalidate_cache(instance)
+        return instance
+
+    def to_representation(self, instance, only=None, exclude=None):
+        cache = None
+
+        # Sparse representations aren't cached
+        if only is None and exclude is None:
+            cache = self.get_cache()
+
+        if cache is not None:
+            key = self.get_cache_key(instance)
+
+            if key is None:
+                cache = None
+            else:
+                version = self.get_cache_version(instance)
+                cached = cache.get(key)
+
+                # Callers get their own copy so they can't change the entry
+                if cached is not None and cached[0] == version:
+                    return copy.deepcopy(cached[1])
+
+        only = parse_fieldset(only)
+        exclude = parse_fieldset(exclude)
+
         data = {}
 
         for field in self.readable_fields:
+            field_name = field.field_name
+            field_only = None
+            field_exclude = None
+
+            if only is not None:
+                if field_name not in only:
+                    continue
+
+                field_only = only[field_name]
+
+            if exclude is not None and field_name in exclude:
+                field_exclude = exclude[field_name]
+
+                if field_exclude is None:
+                    continue
+
             try:
                 attribute = field.get_attribute(instance)
             except SkipField:
                 continue
 
             if attribute is None:
-                data[field.field_name] = None
+                data[field_name] = None
+            elif (field_only is None and field_exclude is None) or not isinstance(
+                field, BaseSerializer
+            ):
+                data[field_name] = field.to_representation(attribute)
             else:
-                data[field.field_name] = field.to_representation(attribute)
+                data[field_name] = field.to_representation(
+                    attribute, only=field_only, exclude=field_exclude
+                )
+
+        if cache is not None:
+            cache.set(key, (version, copy.deepcopy(data)))
 
         return data
 
@@ -346,6 +938,10 @@ class ListSerializer(BaseSerializer):
     def get_initial(self):
         return []
 
+    def get_children(self):
+        return (self.child,)
+
+    @bounded_validation
     def run_validation(self, data):
         data = self.validate_empty_values(data)
 
@@ -353,15 +949,7 @@ class ListSerializer(BaseSerializer):
             return data
 
         value = self.to_internal_value(data)
-
-        try:
-            value = self.run_validators(value)
-            value = self.validate(value)
-        except ValidationError as e:
-            if isinstance(e.errors, dict):
-                raise
-            else:
-                raise ValidationError({"_": e.errors})
+        value = self.run_serializer_validation(value)
 
         return value
 
@@ -372,30 +960,43 @@ class ListSerializer(BaseSerializer):
         if not isinstance(data, list):
             self.fail("not_a_list")
 
-        values = []
-        errors = {}
-
-        for i, x in enumerate(data):
-            try:
-                value = self.child.run_validation(x)
-            except ValidationError as e:
-                errors[i] = e.errors
-            else:
-                values.append(value)
-
-        if errors:
-            raise ValidationError(errors)
+        collector = ErrorCollector()
+        values = self.collect_items(data, collector)
+        collector.raise_errors()
 
         return values
 
-    def to_representation(self, values):
+    def collect_items(self, data, collector):
+        return collect_items(self.child, data, collector)
+
+    def collect_validation(self, data, collector):
+        # Subclass changes how values are validated
+        if overrides(self, ListSerializer, "run_validation", "to_internal_value"):
+            return super(ListSerializer, self).collect_validation(data, collector)
+
+        return collect_container(
+            self,
+            data,
+            collector,
+            list,
+            "not_a_list",
+            self.collect_items,
+            self.run_serializer_validation,
+        )
+
+    def to_representation(self, values, only=None, exclude=None):
         data = []
 
+        if only is None and exclude is None:
+            kwargs = {}
+        else:
+            kwargs = {"only": parse_fieldset(only), "exclude": parse_fieldset(exclude)}
+
         for value in values:
             if value is None:
                 data.append(None)
             else:
-                data.append(self.child.to_representation(value))
+                data.append(self.child.to_representation(value, **kwargs))
 
         return data
 
@@ -415,6 +1016,7 @@ class ProxySerializer(BaseSerializer):
     def get_deserializer(self, data):
         raise NotImplementedError
 
+    @bounded_validation
     def run_validation(self, data):
         serializer = self.get_deserializer(data)
         serializer.bind(self)
@@ -425,10 +1027,10 @@ class ProxySerializer(BaseSerializer):
         serializer.bind(self)
         return serializer.to_internal_value(data)
 
-    def to_representation(self, value):
+    def to_representation(self, value, **kwargs):
         serializer = self.get_serializer(value)
         serializer.bind(self)
-        return serializer.to_representation(value)
+        return serializer.to_representation(value, **kwargs)
 
     def create(self, validated_data):
         serializer = self.get_serializer(validated_data)
@@ -441,3 +1043,144 @@ class ProxySerializer(BaseSerializer):
         serializer.bind(self)
         instance = serializer.update(instance, validated_data)
         return instance
+
+
+class PolymorphicSerializer(BaseSerializer):
+    """Dispatch to a serializer chosen by a discriminator key.
+
+    One serializer is built and bound per type when the polymorphic
+    serializer is constructed, so each value only costs a dict lookup.
+    """
+
+    type_field = "type"
+    serializer_classes: dict = {}
+
+    error_messages = {
+        "not_a_dict": "Expected an object.",
+        "invalid_type": "Not a valid type.",
+    }
+
+    def __init__(self, *args, **kwargs):
+        self.type_field = kwargs.pop("type_field", self.type_field)
+        serializer_classes = kwargs.pop("serializer_classes", self.serializer_classes)
+
+        super(PolymorphicSerializer, self).__init__(*args, **kwargs)
+
+        self.serializers = {}
+
+        for type_name, serializer_class in serializer_classes.items():
+            serializer = serializer_class()
+            serializer.bind(self)
+            self.serializers[type_name] = serializer
+
+            # Rows keep the type so create can dispatch on them
+            if isinstance(serializer, Serializer):
+                serializer.extra_row_keys = (self.type_field,)
+
+    def get_children(self):
+        return self.serializers.values()
+
+    def get_type(self, value):
+        return _get_value(value, self.type_field)
+
+    def get_type_serializer(self, value):
+        try:
+            return self.serializers[self.get_type(value)]
+        except (KeyError, TypeError):
+            raise ValidationError(
+                {self.type_field: self.get_error_message("invalid_type")}
+            )
+
+    def run_partial_validation(self, data, instance):
+        serializer = self.get_type_serializer(instance)
+        return serializer.run_partial_validation(data, instance)
+
+    @bounded_validation
+    def run_validation(self, data):
+        data = self.validate_empty_values(data)
+
+        if data is None:
+            return data
+
+        if not isinstance(data, dict):
+            self.fail("not_a_dict")
+
+        serializer = self.get_type_serializer(data)
+        value = serializer.run_validation(data)
+
+        return self.set_type(value, data)
+
+    def collect_validation(self, data, collector):
+        # Subclass changes how values are validated
+        if overrides(self, PolymorphicSerializer, "run_validation"):
+            return super(PolymorphicSerializer, self).collect_validation(
+                data, collector
+            )
+
+        return collect_container(
+            self, data, collector, dict, "not_a_dict", self._collect_typed
+        )
+
+    def _collect_typed(self, data, collector):
+        try:
+            serializer = self.get_type_serializer(data)
+        except ValidationError as e:
+            collector.add(e.errors)
+            return invalid
+
+        value = serializer.collect_validation(data, collector)
+
+        return self.set_type(value, data)
+
+    def to_internal_value(self, data):
+        serializer = self.get_type_serializer(data)
+        return serializer.to_internal_value(data)
+
+    def set_type(self, value, data):
+        """Add the type from data to a validated value.
+
+        Rows (see Meta.row_type) have a key for the type field. Tuple rows
+        are read-only so are rebuilt with the type.
+        """
+
+        if not isinstance(value, Mapping) or self.type_field in value:
+            return value
+
+        if isinstance(value, MutableMapping):
+            value[self.type_field] = data[self.type_field]
+            return value
+
+        values = dict(value.items())
+        values[self.type_field] = data[self.type_field]
+
+        return value.__class__(values)
+
+    def to_representation(self, value, only=None, exclude=None):
+        serializer = self.get_type_serializer(value)
+
+        if only is None and exclude is None:
+            data = serializer.to_representation(value)
+        else:
+            only = parse_fieldset(only)
+            exclude = parse_fieldset(exclude)
+            data = serializer.to_representation(value, only=only, exclude=exclude)
+
+            # Discriminator wasn't requested
+            if (only is not None and self.type_field not in only) or (
+                exclude is not None
+                and self.type_field in exclude
+                and exclude[self.type_field] is None
+            ):
+                return data
+
+        data.setdefault(self.type_field, self.get_type(value))
+
+        return data
+
+    def create(self, validated_data):
+        serializer = self.get_type_serializer(validated_data)
+        return serializer.create(validated_data)
+
+    def update(self, instance, validated_data):
+        serializer = self.get_type_serializer(instance)
+        return serializer.update(instance, validated_data)
@@ -1,9 +1,118 @@
+from collections.abc import MutableMapping
+
 from sqlalchemy.sql import sqltypes
 from sqlalchemy.dialects import postgresql
 from sqlalchemy import inspect
 from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm.base import NO_VALUE
 
 from cornflake import fields, serializers
+from cornflake.exceptions import ValidationError
+
+# Model class -> {attribute name: whether the model has that attribute}
+_model_attributes: dict = {}
+
+
+def has_model_attribute(model_class, attr):
+    """Cached per model class version of hasattr(model_class, attr)"""
+
+    try:
+        attributes = _model_attributes[model_class]
+    except KeyError:
+        attributes = _model_attributes.setdefault(model_class, {})
+
+    try:
+        return attributes[attr]
+    except KeyError:
+        result = attributes[attr] = hasattr(model_class, attr)
+        return result
+
+
+def is_changed(instance, attr, value):
+    """True if setting attr to value would change the instance.
+
+    Attributes that haven't been loaded yet are treated as changed rather
+    than loading them to compare.
+    """
+
+    state = inspect(instance)
+
+    if attr in state.attrs:
+        current = state.attrs[attr].loaded_value
+    else:
+        current = getattr(instance, attr, NO_VALUE)
+
+    if current is NO_VALUE:
+        return True
+
+    if current is value:
+        return False
+
+    # Check the type too as e.g. 1 == True and 1 == 1.0
+    return type(current) is not type(value) or current != value
+
+
+class InstanceData(MutableMapping):
+    """Validated data written straight onto a model instance.
+
+    Keys that aren't model attributes are kept in a dict. Attributes of an
+    existing instance are recorded before they are first written so they
+    can be restored with rollback().
+    """
+
+    def __init__(self, instance, new=False, write_changes_only=False):
+        self.instance = instance
+        self.new = new
+        self.write_changes_only = write_changes_only
+        self.extra = {}
+        self.changed_fields = set()
+        self._keys = {}
+        self._previous = {}
+
+    def __getitem__(self, key):
+        if key in self.extra:
+            return self.extra[key]
+        elif key in self._keys:
+            return getattr(self.instance, key)
+        else:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        instance = self.instance
+
+        if not has_model_attribute(type(instance), key):
+            self.extra[key] = value
+            return
+
+        self._keys[key] = None
+
+        if self.write_changes_only and not is_changed(instance, key, value):
+            return
+
+        if not self.new and key not in self._previous:
+            self._previous[key] = getattr(instance, key)
+
+        setattr(instance, key, value)
+        self.changed_fields.add(key)
+
+    def __delitem__(self, key):
+        if key in self.extra:
+            del self.extra[key]
+        else:
+            del self._keys[key]
+
+    def __iter__(self):
+        return iter(list(self._keys) + list(self.extra))
+
+    def __len__(self):
+        return len(self._keys) + len(self.extra)
+
+    def rollback(self):
+        for key, value in self._previous.items():
+            setattr(self.instance, key, value)
+
+        self._previous = {}
+        self.changed_fields = set()
 
 
 class ModelSerializer(serializers.Serializer):
@@ -23,6 +132,12 @@ class ModelSerializer(serializers.Serializer):
     class Meta(object):
         model_class = None
 
+    def __init__(self, *args, **kwargs):
+        super(ModelSerializer, self).__init__(*args, **kwargs)
+
+        # Attributes written by the last create/update
+        self.changed_fields = set()
+
     def get_model_class(self):
         model_class = self.Meta.model_class
         assert model_class is not None
@@ -53,6 +168,16 @@ class ModelSerializer(serializers.Serializer):
 
         return set(getattr(self.Meta, "write_only", []))
 
+    def get_write_changes_only(self):
+        """Only write attributes whose value has changed on update"""
+
+        return getattr(self.Meta, "write_changes_only", False)
+
+    def get_validate_into_instance(self):
+        """Write validated values straight onto a model instance"""
+
+        return getattr(self.Meta, "validate_into_instance", False)
+
     def get_field_class(self, col_type):
         for sql_type, field_type in self.type_map.items():
             if isinstance(col_type, sql_type):
@@ -114,20 +239,164 @@ class ModelSerializer(serializers.Serializer):
 
         return fields
 
+    @serializers.bounded_validation
+    def run_validation(self, data):
+        if not self.get_validate_into_instance():
+            return super(ModelSerializer, self).run_validation(data)
+
+        value = self.run_instance_validation(data, self.instance)
+
+        if value is None:
+            return value
+
+        return value.instance
+
+    def run_instance_validation(self, data, instance):
+        """Validate data straight into instance (or a new instance).
+
+        Returns the InstanceData, which has the instance and the fields
+        that were changed. The instance is restored if validation fails.
+        """
+
+        data = self.validate_empty_values(data)
+
+        if data is None:
+            return data
+
+        if not isinstance(data, dict):
+            self.fail("not_a_dict")
+
+        if instance is None:
+            value = InstanceData(self.get_model_class()(), new=True)
+        else:
+            value = InstanceData(
+                instance, write_changes_only=self.get_write_changes_only()
+            )
+
+        try:
+            self._to_internal_value(data, self.writable_fields, value)
+            validated_value = self.run_serializer_validation(value)
+
+            # validate() returned a new dict
+            if validated_value is not value:
+                for attr, attr_value in validated_value.items():
+                    value[attr] = attr_value
+        except BaseException:
+            # Don't leave the instance half written
+            value.rollback()
+            raise
+
+        return value
+
+    def is_valid(
+        self, raise_exception=False, max_errors=None, fail_fast=False, collector=None
+    ):
+        if not self.get_validate_into_instance() or self.partial:
+            return super(ModelSerializer, self).is_valid(
+                raise_exception,
+                max_errors=max_errors,
+                fail_fast=fail_fast,
+                collector=collector,
+            )
+
+        collector = serializers.get_collector(max_errors, fail_fast, collector)
+
+        # The instance is rolled back on any error, so all of the errors
+        # from validating into it are added at once
+        try:
+            value = self.run_instance_validation(self.initial_data, self.instance)
+        except ValidationError as e:
+            collector.add(e.errors)
+
+        self.truncated = collector.truncated
+        self.processed = collector.processed
+
+        if collector.count:
+            self.validated_data = {}
+            self.errors = collector.errors
+
+            if raise_exception:
+                raise ValidationError(self.errors, normalised=True)
+
+            return False
+
+        if value is None:
+            self.validated_data = value
+        else:
+            self.validated_data = value.instance
+            self.changed_fields = value.changed_fields
+
+        self.errors = {}
+
+        return True
+
+    def collect_validation(self, data, collector):
+        # Validating into an instance rolls back on the first error
+        if self.get_validate_into_instance() or fields.overrides(
+            self, ModelSerializer, "run_validation", "to_internal_value"
+        ):
+            return fields.Field.collect_validation(self, data, collector)
+
+        return self._collect_validation(data, collector)
+
+    def save(self, **kwargs):
+        model_class = self.get_model_class()
+
+        # Validated straight into an instance
+        if not isinstance(self.validated_data, model_class):
+            return super(ModelSerializer, self).save(**kwargs)
+
+        instance = self.validated_data
+
+        for attr, value in kwargs.items():
+            if has_model_attribute(model_class, attr):
+                setattr(instance, attr, value)
+                self.changed_fields.add(attr)
+
+        self.instance = instance
+        self.invalidate_cache(instance)
+
+        return instance
+
     def create(self, validated_data):
         model_class = self.get_model_class()
+
+        # Validated straight into an instance
+        if isinstance(validated_data, model_class):
+            return validated_data
+
         instance = model_class()
+        changed_fields = set()
 
         for attr, value in validated_data.items():
-            if hasattr(instance, attr):
+            if has_model_attribute(model_class, attr):
                 setattr(instance, attr, value)
+                changed_fields.add(attr)
+
+        self.changed_fields = changed_fields
 
         return instance
 
     def update(self, instance, validated_data):
+        # Validated straight into the instance
+        if validated_data is instance:
+            return instance
+
+        model_class = type(instance)
+        write_changes_only = self.get_write_changes_only()
+        changed_fields = set()
+
         for attr, value in validated_data.items():
-            if hasattr(instance, attr):
-                setattr(instance, attr, value)
+            if not has_model_attribute(model_class, attr):
+                continue
+
+            if write_changes_only and not is_changed(instance, attr, value):
+                continue
+
+            setattr(instance, attr, value)
+            changed_fields.add(attr)
+
+        self.changed_fields = changed_fields
 
         return instance
 
@@ -192,6 +461,12 @@ class ReferenceField(fields.Field):
         if self.serializer is not None:
             self.serializer.bind(self, field_name)
 
+    def get_children(self):
+        if self.serializer is None:
+            return (self.field,)
+
+        return (self.field, self.serializer)
+
     def get_instance(self, id):
         attribute = getattr(self.model_class, self.model_id)
         instance = self.model_class.query.filter(attribute == id).first()
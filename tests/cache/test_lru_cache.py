@@ -0,0 +1,40 @@
+from cornflake.cache import LRUCache
+
+
+def test_get_set():
+    cache = LRUCache()
+    cache.set("foo", 1)
+
+    assert cache.get("foo") == 1
+    assert cache.get("bar") is None
+    assert cache.get("bar", 2) == 2
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("foo", 1)
+    cache.set("bar", 2)
+    cache.get("foo")
+    cache.set("baz", 3)
+
+    assert len(cache) == 2
+    assert "foo" in cache
+    assert "bar" not in cache
+    assert "baz" in cache
+
+
+def test_delete():
+    cache = LRUCache()
+    cache.set("foo", 1)
+    cache.delete("foo")
+    cache.delete("bar")
+
+    assert "foo" not in cache
+
+
+def test_clear():
+    cache = LRUCache()
+    cache.set("foo", 1)
+    cache.clear()
+
+    assert len(cache) == 0
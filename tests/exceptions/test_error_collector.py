@@ -0,0 +1,59 @@
+import pytest
+
+from cornflake.exceptions import ErrorCollector, ValidationError
+
+
+def test_empty():
+    collector = ErrorCollector()
+
+    assert collector.count == 0
+    assert collector.errors == {}
+    collector.raise_errors()
+
+
+def test_add():
+    collector = ErrorCollector()
+    collector.path.extend(["foo", 0])
+    collector.add(["error @ foo.0"])
+    collector.path[-1] = 1
+    collector.add(["error @ foo.1"])
+    collector.path[:] = ["bar"]
+    collector.add({"baz": ["error @ bar.baz"]})
+    collector.add({"_": ["error @ bar"]})
+
+    assert collector.count == 4
+    assert collector.errors == {
+        "foo": {0: ["error @ foo.0"], 1: ["error @ foo.1"]},
+        "bar": {"baz": ["error @ bar.baz"], "_": ["error @ bar"]},
+    }
+
+    with pytest.raises(ValidationError) as e:
+        collector.raise_errors()
+
+    assert e.value.errors == collector.errors
+
+
+def test_add_root():
+    collector = ErrorCollector()
+    collector.add(["foo"])
+    collector.add(["bar"])
+
+    assert collector.errors == ["foo", "bar"]
+
+
+def test_max_errors():
+    collector = ErrorCollector(max_errors=2)
+    collector.add(["a"])
+    assert not collector.full
+    collector.add(["b"])
+    assert collector.full
+
+    collector.truncated = True
+    collector.processed = 3
+
+    with pytest.raises(ValidationError) as e:
+        collector.raise_errors()
+
+    assert e.value.truncated
+    assert e.value.processed == 3
+    assert not ValidationError("foo").truncated
@@ -0,0 +1,55 @@
+from cornflake import fields
+from cornflake.exceptions import ErrorSummary
+from cornflake.serializers import ListSerializer, Serializer
+
+
+class FooSerializer(Serializer):
+    foo = fields.IntegerField()
+    bar = fields.DateField(required=False)
+
+
+def test_add():
+    summary = ErrorSummary(max_samples=2)
+
+    for row in [3, 5, 8]:
+        summary.path[:] = [row, "foo"]
+        summary.add(["Invalid."])
+
+    summary.path[:] = [9]
+    summary.add({"bar": ["Required."], "baz": {"qux": ["Bad."]}})
+    summary.path[:] = []
+    summary.add(["Too many."])
+
+    assert summary.count == 5
+    assert summary.summary() == [
+        (("foo",), "Invalid.", 3, [3, 5]),
+        (("bar",), "Required.", 1, [9]),
+        (("baz", "qux"), "Bad.", 1, [9]),
+        ((), "Too many.", 1, []),
+    ]
+    assert summary.errors == {
+        "foo": ["Invalid. (3 rows, first at 3, 5)"],
+        "bar": ["Required. (1 rows, first at 9)"],
+        "baz": {"qux": ["Bad. (1 rows, first at 9)"]},
+        "_": ["Too many."],
+    }
+
+
+def test_is_valid():
+    data = [{"foo": "x"}] * 1000 + [{"foo": 1, "bar": "y"}]
+
+    summary = ErrorSummary()
+    serializer = ListSerializer(child=FooSerializer(), data=data)
+
+    assert not serializer.is_valid(collector=summary)
+    assert [x[2:] for x in summary.summary()] == [(1000, [0, 1, 2]), (1, [1000])]
+    assert list(serializer.errors) == ["foo", "bar"]
+
+    summary = ErrorSummary()
+    result = ListSerializer(child=FooSerializer()).run_bounded_validation(
+        data, max_errors=10, collector=summary
+    )[1]
+
+    assert result is summary
+    assert summary.count == 10
+    assert summary.truncated
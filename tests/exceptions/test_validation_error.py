@@ -156,3 +156,46 @@ def test_first_dict_in_list():
         ]
     )
     assert e.first() == (("foo",), "error @ 0.foo")
+
+
+def test_normalise_plain_dict():
+    e = ValidationError(OrderedDict([("foo", "bar")]))
+    assert type(e.errors) is dict
+
+
+def test_normalised():
+    errors = {"foo": {0: ["bar"]}}
+    e = ValidationError(errors, normalised=True)
+    assert e.errors is errors
+
+
+def test_flatten():
+    e = ValidationError(
+        {
+            "foo": ["error @ foo"],
+            "bar": {0: ["error @ bar.0"], 1: {"baz": ["a", "b"]}},
+            "baz": [{"qux": "error @ baz.qux"}],
+        }
+    )
+
+    assert e.flatten() == [
+        (("foo",), "error @ foo"),
+        (("bar", 0), "error @ bar.0"),
+        (("bar", 1, "baz"), "a"),
+        (("bar", 1, "baz"), "b"),
+        (("baz", "qux"), "error @ baz.qux"),
+    ]
+    assert next(e.iter_flat()) == (("foo",), "error @ foo")
+
+
+def test_flatten_deep():
+    errors = ["bottom"]
+
+    for i in range(5000):
+        errors = {i: errors}
+
+    e = ValidationError(errors, normalised=True)
+
+    path, message = e.first()
+    assert len(path) == 5000
+    assert message == "bottom"
@@ -2,7 +2,12 @@ from datetime import date
 
 import pytest
 
-from cornflake.fields import CommaSeparatedField, DateField, ValidationError
+from cornflake.fields import (
+    CommaSeparatedField,
+    DateField,
+    IntegerField,
+    ValidationError,
+)
 
 
 @pytest.mark.parametrize(
@@ -46,3 +51,29 @@ def test_to_internal_value(data, expected):
 def test_to_internal_value_invalid(data):
     with pytest.raises(ValidationError):
         CommaSeparatedField(child=DateField()).to_internal_value(data)
+
+
+def test_coerce_items():
+    field = CommaSeparatedField(child=IntegerField())
+    assert field.to_internal_value("1, 2,3") == [1, 2, 3]
+    assert field.to_internal_value([1, "2"]) == [1, 2]
+
+    with pytest.raises(ValidationError):
+        field.to_internal_value("1,x")
+
+    field = CommaSeparatedField(child=IntegerField(required=False))
+    assert field.to_internal_value([1, None]) == [1, None]
+
+
+def test_coerce_items_validator_added():
+    def positive(value):
+        if value < 0:
+            raise ValidationError("Negative.")
+
+        return value
+
+    field = CommaSeparatedField(child=IntegerField())
+    field.child.validators.append(positive)
+
+    with pytest.raises(ValidationError):
+        field.to_internal_value("1,-1")
@@ -48,3 +48,9 @@ def test_to_internal_value(data, expected):
 def test_to_internal_value_invalid(data):
     with pytest.raises(ValidationError):
         EnumField(Foo).to_internal_value(data)
+
+
+def test_trusted():
+    field = EnumField(Foo, trusted=True)
+    assert field.run_validation(Foo.a) is Foo.a
+    assert field.run_validation("foo") is Foo.a
@@ -2,7 +2,7 @@ import copy
 
 import pytest
 
-from cornflake.fields import Field, empty
+from cornflake.fields import Field, ListField, empty, using_context
 from cornflake.exceptions import ValidationError, SkipField
 
 
@@ -65,7 +65,10 @@ def test_source():
 
 
 def test_deepcopy():
-    field = Field(source="foo")
+    class FooField(Field):
+        pass
+
+    field = FooField(source="foo")
     field.foo = "bar"
     field = copy.deepcopy(field)
     assert field.source == "foo"
@@ -204,7 +207,122 @@ def test_set_context():
         def set_context(self, parent):
             self.parent = parent
 
-    field = Field(validators=[f()])
+    class FooField(Field):
+        pass
+
+    field = FooField(validators=[f()])
     field.foo = "bar"
 
     assert field.run_validation(123) == "bar"
+
+
+def test_slots():
+    field = Field()
+
+    with pytest.raises(AttributeError):
+        field.foo = "bar"
+
+
+def test_error_messages_shared():
+    class Foo(Field):
+        error_messages = {"a": "b"}
+
+    assert Foo().error_messages.maps[1] is Foo().error_messages.maps[1]
+    assert Foo.error_messages == {"required": "This field is required.", "a": "b"}
+    assert Foo(error_messages={"a": "c"}).error_messages == {
+        "required": "This field is required.",
+        "a": "c",
+    }
+    assert Foo.error_messages["a"] == "b"
+    assert Field.error_messages == {"required": "This field is required."}
+
+
+def test_error_messages_subclass():
+    class Foo(Field):
+        error_messages = {"a": "b", "c": "d"}
+
+    class Bar(Foo):
+        error_messages = {"a": "e"}
+
+    overrides = {"c": "f"}
+    field = Bar(error_messages=overrides)
+    field.error_messages["g"] = "h"
+
+    assert Foo.error_messages == {
+        "required": "This field is required.",
+        "a": "b",
+        "c": "d",
+    }
+    assert Bar.error_messages == {
+        "required": "This field is required.",
+        "a": "e",
+        "c": "d",
+    }
+    assert field.error_messages["c"] == "f"
+    assert overrides == {"c": "f"}
+    assert "g" not in Bar.error_messages
+
+
+def test_root_propagated():
+    child = Field()
+    list_field = ListField(child=child)
+    parent = Field()
+
+    assert child.root is list_field
+
+    list_field.bind(parent)
+
+    assert list_field.root is parent
+    assert child.root is parent
+
+    list_field.bind(None)
+
+    assert child.root is list_field
+
+
+def test_using_context():
+    class Root(object):
+        parent = None
+        _context = {"foo": "root"}
+
+    class OtherRoot(object):
+        parent = None
+        _context = {"foo": "other"}
+
+    root = Root()
+    field = Field()
+    field.bind(root)
+    other = Field()
+    other.bind(OtherRoot())
+
+    assert field.context == {"foo": "root"}
+
+    with using_context(root, {"foo": "call"}) as context:
+        assert field.context is context
+        assert other.context == {"foo": "other"}
+
+        with using_context(root, {"foo": "nested"}):
+            assert field.context == {"foo": "nested"}
+
+        assert field.context is context
+
+    assert field.context == {"foo": "root"}
+
+
+def test_error_messages_copy_on_write():
+    class Foo(Field):
+        error_messages = {"a": "b"}
+
+    field = Foo()
+    assert field.get_error_message("a") == "b"
+    assert not hasattr(field, "_error_messages")
+
+    field.error_messages["a"] = "c"
+
+    assert field.error_messages["a"] == "c"
+    assert field.get_error_message("a") == "c"
+    assert Foo().error_messages["a"] == "b"
+    assert Foo.error_messages["a"] == "b"
+
+    with pytest.raises(TypeError):
+        Foo.error_messages["a"] = "d"
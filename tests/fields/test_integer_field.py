@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 
 from cornflake.fields import IntegerField, ValidationError
@@ -27,6 +29,11 @@ def test_to_representation(value, expected):
         (-123, -123),
         (True, 1),
         (False, 0),
+        (123.0, 123),
+        (Decimal("123"), 123),
+        (Decimal("123.000"), 123),
+        ("9007199254740993", 9007199254740993),
+        (" 123\n", 123),
     ],
 )
 def test_to_internal_value(data, expected):
@@ -38,6 +45,12 @@ def test_to_internal_value(data, expected):
     [
         123.456,
         "123.456",
+        float("nan"),
+        float("inf"),
+        Decimal("123.5"),
+        Decimal("Infinity"),
+        Decimal("NaN"),
+        None,
         "hello",
         "",
         {"foo": 1, "bar": 2},
@@ -47,3 +60,47 @@ def test_to_internal_value(data, expected):
 def test_to_internal_value_invalid(data):
     with pytest.raises(ValidationError):
         IntegerField().to_internal_value(data)
+
+
+def test_trusted():
+    field = IntegerField(trusted=True)
+    assert field.run_validation(123) == 123
+    assert field.run_validation(" 123 ") == 123
+
+    with pytest.raises(ValidationError):
+        field.run_validation(1.5)
+
+
+def test_to_internal_value_big():
+    value = IntegerField().to_internal_value(str(2**64 + 1))
+    assert value == 2**64 + 1
+    assert type(value) is int
+
+
+def test_coerce_many():
+    field = IntegerField()
+    assert field.coerce_many(["1", 2, " 3 ", 4.0, True]) == [1, 2, 3, 4, 1]
+    assert field.coerce_many([]) == []
+
+    with pytest.raises(ValidationError):
+        field.coerce_many(["1", "x"])
+
+    with pytest.raises(ValidationError):
+        field.coerce_many(["1", 2.5])
+
+
+def test_coerce_many_subclass():
+    class PositiveIntegerField(IntegerField):
+        def to_internal_value(self, data):
+            value = super(PositiveIntegerField, self).to_internal_value(data)
+
+            if value < 0:
+                self.fail("invalid")
+
+            return value
+
+    field = PositiveIntegerField()
+    assert field.coerce_many(["1", 2]) == [1, 2]
+
+    with pytest.raises(ValidationError):
+        field.coerce_many(["-1"])
@@ -2,7 +2,15 @@ from datetime import date
 
 import pytest
 
-from cornflake.fields import ListField, DateField, StringField, IntegerField, empty
+from cornflake.fields import (
+    CommaSeparatedField,
+    DateField,
+    FloatField,
+    IntegerField,
+    ListField,
+    StringField,
+    empty,
+)
 from cornflake.serializers import Serializer
 from cornflake.exceptions import ValidationError
 
@@ -97,3 +105,73 @@ def test_default():
     # Default should be an empty list
     assert field.run_validation(empty) == []
     assert field.run_validation(None) == []
+
+
+def test_coerce_items():
+    field = ListField(child=IntegerField())
+    assert field._coerce_items
+    assert field.to_internal_value(["1", 2, " 3 "]) == [1, 2, 3]
+
+    with pytest.raises(ValidationError) as e:
+        field.to_internal_value(["1", "x", 3, "y"])
+
+    assert e.value.errors == {
+        1: ["A valid integer is required."],
+        3: ["A valid integer is required."],
+    }
+
+    field = ListField(child=StringField(max_length=2, intern=True))
+    assert field.to_internal_value([" ab "]) == ["ab"]
+
+    with pytest.raises(ValidationError) as e:
+        field.to_internal_value(["ab", "abc"])
+
+    assert list(e.value.errors) == [1]
+
+    def double(value):
+        return value * 2
+
+    field = ListField(child=IntegerField(validators=[double]))
+    assert field.to_internal_value(["1", 2]) == [2, 4]
+
+    def positive(value):
+        if value < 0:
+            raise ValidationError("Negative.")
+
+        return value
+
+    field = ListField(child=IntegerField())
+    field.child.validators.append(positive)
+
+    with pytest.raises(ValidationError) as e:
+        field.to_internal_value([1, -1])
+
+    assert e.value.errors == {1: ["Negative."]}
+
+
+class PositiveIntegerField(IntegerField):
+    def to_internal_value(self, data):
+        value = super(PositiveIntegerField, self).to_internal_value(data)
+
+        if value < 0:
+            self.fail("invalid")
+
+        return value
+
+
+def test_coerce_items_subclass():
+    class KiloField(FloatField):
+        def to_internal_value(self, data):
+            return super(KiloField, self).to_internal_value(data) / 1000
+
+    field = ListField(child=PositiveIntegerField())
+
+    with pytest.raises(ValidationError) as e:
+        field.run_validation(["-1", "2"])
+
+    assert list(e.value.errors) == [0]
+
+    with pytest.raises(ValidationError):
+        CommaSeparatedField(child=PositiveIntegerField()).run_validation("-1,2")
+
+    assert ListField(child=KiloField()).run_validation(["1000", 2000]) == [1.0, 2.0]
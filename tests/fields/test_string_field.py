@@ -1,6 +1,6 @@
 import pytest
 
-from cornflake.fields import StringField, ValidationError
+from cornflake.fields import CommaSeparatedField, StringField, ValidationError
 
 
 @pytest.mark.parametrize(
@@ -52,3 +52,99 @@ def test_trim_whitespace_false():
     field = StringField(trim_whitespace=False)
     value = field.to_internal_value(" abc ")
     assert value == " abc "
+
+
+def test_trusted():
+    field = StringField(trusted=True)
+    assert field.run_validation(" foo ") == " foo "
+    assert field.run_validation(123) == "123"
+
+    with pytest.raises(ValidationError):
+        field.run_validation(True)
+
+    assert StringField().run_validation(" foo ") == "foo"
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ("foo bar", "foo bar"),
+        (" foo   bar ", "foo bar"),
+        ("foo\tbar", "foo bar"),
+        ("foo\t bar", "foo bar"),
+        ("foo\n\nbar", "foo bar"),
+        ("foo\nbar", "foo\nbar"),
+        ("fóo  bär", "fóo bär"),
+    ],
+)
+def test_normalise_whitespace(data, expected):
+    assert StringField(normalise_whitespace=True).to_internal_value(data) == expected
+
+
+@pytest.mark.parametrize(
+    ("case", "data", "expected"),
+    [
+        ("upper", "Foo", "FOO"),
+        ("upper", "FOO", "FOO"),
+        ("upper", "straße", "STRASSE"),
+        ("lower", "Foo", "foo"),
+        ("lower", "foo", "foo"),
+        ("lower", "ÉCOLE", "école"),
+    ],
+)
+def test_case(case, data, expected):
+    assert StringField(case=case).to_internal_value(data) == expected
+
+
+def test_length():
+    field = StringField(min_length=2, max_length=3)
+    assert field.run_validation(" ab ") == "ab"
+    assert field.run_validation("abc") == "abc"
+
+    with pytest.raises(ValidationError) as e:
+        field.run_validation("a")
+
+    assert e.value.errors == ["Value is too short (min length is 2 characters)."]
+
+    with pytest.raises(ValidationError) as e:
+        field.run_validation("abcd")
+
+    assert e.value.errors == ["Value is too long (max length is 3 characters)."]
+
+
+def test_normalise():
+    field = StringField(normalise_whitespace=True, case="upper", max_length=7)
+    assert field.run_validation("  foo \t bar ") == "FOO BAR"
+
+
+def test_intern():
+    field = StringField(intern=True)
+    a = field.run_validation("".join(["f", "oo"]))
+    b = field.run_validation(" foo ")
+    assert a == "foo"
+    assert a is b
+
+    field = StringField(intern=2)
+    values = [field.run_validation(str(x)) for x in [100, 200, 300, 100, 300]]
+    assert values == ["100", "200", "300", "100", "300"]
+    assert values[0] is values[3]
+    assert values[2] is not values[4]
+    assert len(field._interned) == 2
+
+    field = StringField(intern=True, required=False)
+    assert field.run_validation(None) is None
+
+
+def test_intern_comma_separated():
+    field = CommaSeparatedField(child=StringField(intern=True))
+    a = field.run_validation("foo,bar")
+    b = field.run_validation("bar, foo")
+    assert a[0] is b[1]
+    assert a[1] is b[0]
+
+
+def test_trusted_normalise():
+    field = StringField(case="upper", normalise_whitespace=True, trusted=True)
+    assert field.run_validation("a  bc ") == "A BC"
+
+    assert StringField(max_length=1, trusted=True).native_types == (str,)
@@ -0,0 +1,190 @@
+import io
+import json
+from datetime import date
+
+import pytest
+
+from cornflake import fields
+from cornflake.ingest import (
+    CSVErrorWriter,
+    find_chunks,
+    format_errors,
+    get_decoder,
+    ingest,
+    read_csv,
+    validate_jsonl,
+    validate_jsonl_parallel,
+)
+from cornflake.serializers import Serializer
+
+
+class PatientSerializer(Serializer):
+    name = fields.StringField()
+    birth_date = fields.DateField()
+    weight = fields.FloatField(required=False)
+
+
+CSV = (
+    "Name,birth_date,weight,notes\n"
+    "Alice,2001-02-03,60.5,foo\n"
+    "Bob,not a date,,bar\n"
+    '"Carol\nSmith",2002-03-04,,\n'
+    ",2003-04-05,70,baz\n"
+)
+
+
+def test_read_csv():
+    rows = list(read_csv(io.StringIO(CSV), PatientSerializer, columns={"Name": "name"}))
+
+    assert rows[0] == (
+        2,
+        {"name": "Alice", "birth_date": "2001-02-03", "weight": "60.5"},
+    )
+    assert rows[1][1]["weight"] is None
+    assert [x[0] for x in rows] == [2, 3, 5, 6]
+
+
+def run_ingest(**kwargs):
+    valid = []
+    errors = []
+    progress = []
+
+    result = ingest(
+        io.StringIO(CSV),
+        PatientSerializer,
+        valid.extend,
+        errors.extend,
+        columns={"Name": "name"},
+        batch_size=2,
+        progress=lambda x: progress.append(x.rows),
+        **kwargs,
+    )
+
+    return result, valid, errors, progress
+
+
+def test_ingest():
+    result, valid, errors, progress = run_ingest()
+
+    assert (result.rows, result.valid, result.invalid) == (4, 2, 2)
+    assert result.rows_per_second > 0
+    assert progress == [2, 4]
+    assert valid == [
+        {"name": "Alice", "birth_date": date(2001, 2, 3), "weight": 60.5},
+        {"name": "Carol\nSmith", "birth_date": date(2002, 3, 4), "weight": None},
+    ]
+    assert [(x[0], x[2]) for x in errors] == [
+        (3, {"birth_date": ["Invalid date format."]}),
+        (6, {"name": ["This field is required."]}),
+    ]
+
+
+def test_ingest_processes():
+    assert run_ingest(processes=2)[1:3] == run_ingest()[1:3]
+
+
+def test_error_writer():
+    fp = io.StringIO()
+    writer = CSVErrorWriter(fp, ["name", "birth_date"])
+    writer([(3, {"name": "Bob", "birth_date": "x"}, {"birth_date": ["Bad."]})])
+
+    assert fp.getvalue().splitlines() == [
+        "line,name,birth_date,errors",
+        "3,Bob,x,birth_date: Bad.",
+    ]
+
+
+def test_format_errors():
+    assert format_errors({"a": ["b", "c"], "d": {0: ["e"]}}) == "a: b; a: c; d.0: e"
+    assert format_errors(["a"]) == "a"
+
+
+JSONL = (
+    '{"name": "Alice", "birth_date": "2001-02-03", "weight": 60.5}\n'
+    "\n"
+    '{"name": "Bob", "birth_date": "x"}\n'
+    "{not json\n"
+    '{"name": "Carol", "birth_date": "2002-03-04"}\n'
+)
+
+
+def test_validate_jsonl():
+    results = list(validate_jsonl(io.StringIO(JSONL), PatientSerializer))
+
+    assert [x[0] for x in results] == [1, 3, 4, 5]
+    assert [bool(x[1]) for x in results] == [True, False, False, True]
+    assert results[0][1].validated_data == {
+        "name": "Alice",
+        "birth_date": date(2001, 2, 3),
+        "weight": 60.5,
+    }
+    assert results[1][1].errors == {"birth_date": ["Invalid date format."]}
+    assert results[2][1].errors == {"_": ["Invalid JSON."]}
+
+
+@pytest.mark.parametrize("decoder", ["json", "auto", json.loads])
+def test_validate_jsonl_path(tmp_path, decoder):
+    path = tmp_path / "data.jsonl"
+    path.write_text(JSONL)
+
+    results = list(validate_jsonl(str(path), PatientSerializer, decoder=decoder))
+    assert [(x[0], bool(x[1])) for x in results] == [
+        (1, True),
+        (3, False),
+        (4, False),
+        (5, True),
+    ]
+
+
+def test_get_decoder():
+    assert get_decoder() is json.loads
+    assert get_decoder("json") is json.loads
+    assert callable(get_decoder("auto"))
+
+    with pytest.raises(ImportError):
+        get_decoder("no_such_decoder")
+
+
+def test_find_chunks(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b"aaaa\nbb\n\ncccccc\nd")
+
+    assert find_chunks(str(path), chunk_size=3) == [
+        (0, 5),
+        (5, 8),
+        (8, 16),
+        (16, 17),
+    ]
+    assert find_chunks(str(path), chunk_size=8) == [(0, 8), (8, 16), (16, 17)]
+    assert find_chunks(str(path)) == [(0, 17)]
+
+    path.write_bytes(b"")
+    assert find_chunks(str(path)) == []
+
+    with pytest.raises(AssertionError):
+        find_chunks(str(path), chunk_size=0)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_validate_jsonl_parallel(tmp_path, processes):
+    path = tmp_path / "data.jsonl"
+    path.write_text(JSONL * 3 + '{"name": "Dan"}')
+
+    errors = []
+    result = validate_jsonl_parallel(
+        str(path),
+        PatientSerializer,
+        error_sink=errors.extend,
+        processes=processes,
+        chunk_size=50,
+    )
+
+    expected = [
+        (line_num, x.errors)
+        for line_num, x in validate_jsonl(str(path), PatientSerializer)
+        if x.errors
+    ]
+
+    assert (result.rows, result.valid, result.invalid) == (13, 6, 7)
+    assert errors == expected
+    assert errors[-1] == (16, {"birth_date": ["This field is required."]})
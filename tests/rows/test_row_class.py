@@ -0,0 +1,53 @@
+import pytest
+
+from cornflake.rows import row_class
+
+
+@pytest.mark.parametrize("row_type", ["slots", "tuple"])
+def test_mapping(row_type):
+    cls = row_class("Foo", ["foo", "items", "keys"], row_type)
+    row = cls({"foo": 1, "items": 2})
+
+    assert row["foo"] == 1
+    assert row["items"] == 2
+    assert row.get("keys") is None
+    assert "foo" in row
+    assert "keys" not in row
+    assert list(row.keys()) == ["foo", "items"]
+    assert list(row.items()) == [("foo", 1), ("items", 2)]
+    assert len(row) == 2
+    assert dict(row) == {"foo": 1, "items": 2}
+    assert row == {"foo": 1, "items": 2}
+
+    with pytest.raises(KeyError):
+        row["keys"]
+
+    with pytest.raises(KeyError):
+        row["bar"]
+
+    with pytest.raises(KeyError):
+        cls({"bar": 1})
+
+
+def test_slots():
+    cls = row_class("Foo", ["foo", "bar"], "slots")
+    row = cls({"foo": 1})
+    row["bar"] = 2
+    del row["foo"]
+
+    assert row == {"bar": 2}
+    assert not hasattr(row, "__dict__")
+
+
+def test_tuple():
+    cls = row_class("Foo", ["foo", "bar"], "tuple")
+    row = cls({"foo": 1, "bar": 2})
+
+    assert isinstance(row, tuple)
+    assert row[0] == 1
+    assert row[1] == 2
+
+
+def test_cached():
+    assert row_class("Foo", ["foo"]) is row_class("Foo", ["foo"])
+    assert row_class("Foo", ["foo"]) is not row_class("Foo", ["foo", "bar"])
@@ -4,8 +4,8 @@ import pytest
 
 from cornflake import fields
 from cornflake.serializers import Serializer, ListSerializer
-from cornflake.exceptions import ValidationError
-from cornflake.fields import empty
+from cornflake.exceptions import ErrorCollector, ValidationError
+from cornflake.fields import empty, invalid
 
 
 class FooSerializer(Serializer):
@@ -118,3 +118,135 @@ def test_default():
     # Default should be an empty list
     assert field.run_validation(empty) == []
     assert field.run_validation(None) == []
+
+
+def test_to_representation_only():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.IntegerField()
+
+    serializer = ListSerializer(child=FooSerializer())
+
+    assert serializer.to_representation(
+        [{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}], only=["foo"]
+    ) == [{"foo": 1}, {"foo": 3}]
+
+
+def test_collect_validation():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.ListField(child=fields.IntegerField())
+
+        def validate(self, data):
+            if data["foo"] < 0:
+                raise ValidationError("Negative.")
+
+            return data
+
+    serializer = ListSerializer(child=FooSerializer())
+    data = [
+        {"foo": 1, "bar": [1, 2]},
+        {"foo": "x", "bar": [1, "y", "z"]},
+        {"foo": -1, "bar": []},
+        "foo",
+    ]
+    expected = {
+        1: {
+            "foo": ["A valid integer is required."],
+            "bar": {
+                1: ["A valid integer is required."],
+                2: ["A valid integer is required."],
+            },
+        },
+        2: {"_": ["Negative."]},
+        3: ["Expected an object."],
+    }
+
+    collector = ErrorCollector()
+    assert serializer.collect_validation(data, collector) is invalid
+    assert collector.count == 5
+    assert collector.errors == expected
+
+    with pytest.raises(ValidationError) as e:
+        serializer.run_validation(data)
+
+    assert e.value.errors == expected
+
+    serializer = ListSerializer(child=FooSerializer(), data=data)
+    assert not serializer.is_valid()
+    assert serializer.errors == expected
+
+
+def test_collect_validation_overridden():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+
+        def to_internal_value(self, data):
+            raise ValidationError("Overridden.")
+
+    serializer = ListSerializer(child=FooSerializer(), data=[{"foo": 1}])
+    assert not serializer.is_valid()
+    assert serializer.errors == {0: ["Overridden."]}
+
+
+def test_max_errors():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.IntegerField()
+
+    data = [{"foo": "a", "bar": "b"}, {"foo": 1, "bar": 2}, {"foo": "c", "bar": 3}]
+
+    serializer = ListSerializer(child=FooSerializer(), data=data)
+    assert not serializer.is_valid(max_errors=2)
+    assert serializer.errors == {
+        0: {
+            "foo": [fields.IntegerField.error_messages["invalid"]],
+            "bar": [fields.IntegerField.error_messages["invalid"]],
+        }
+    }
+    assert serializer.truncated
+    assert serializer.processed == 1
+
+    serializer = ListSerializer(child=FooSerializer(), data=data)
+    assert not serializer.is_valid(max_errors=4)
+    assert len(serializer.errors) == 2
+    assert not serializer.truncated
+    assert serializer.processed == 3
+
+
+def test_fail_fast():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.IntegerField()
+
+    data = [{"foo": 1, "bar": 2}, {"foo": "a", "bar": "b"}, {"foo": "c", "bar": 3}]
+
+    serializer = ListSerializer(child=FooSerializer(), data=data)
+    assert not serializer.is_valid(fail_fast=True)
+    assert list(serializer.errors) == [1]
+    assert list(serializer.errors[1]) == ["foo"]
+    assert serializer.truncated
+    assert serializer.processed == 2
+
+    with pytest.raises(ValidationError) as e:
+        ListSerializer(child=FooSerializer()).run_validation(data, fail_fast=True)
+
+    assert e.value.errors == serializer.errors
+    assert e.value.truncated
+    assert e.value.processed == 2
+
+    result = ListSerializer(child=FooSerializer()).run_bounded_validation(data)[1]
+    assert result.count == 3
+    assert not result.truncated
+
+
+def test_trusted():
+    class FooSerializer(Serializer):
+        foo = fields.StringField()
+
+    serializer = ListSerializer(child=FooSerializer(), trusted=True)
+    assert serializer.run_validation([{"foo": " a "}]) == [{"foo": " a "}]
+
+    serializer = ListSerializer(child=FooSerializer(trusted=True))
+    assert serializer.child.fields["foo"].is_trusted()
+    assert not serializer.is_trusted()
@@ -0,0 +1,173 @@
+import pytest
+
+from cornflake.serializers import ListSerializer, PolymorphicSerializer, Serializer
+from cornflake import fields
+from cornflake.exceptions import ValidationError
+
+
+class CatSerializer(Serializer):
+    name = fields.StringField()
+    lives = fields.IntegerField()
+
+    def create(self, validated_data):
+        return ("cat", validated_data)
+
+
+class DogSerializer(Serializer):
+    name = fields.StringField()
+    good = fields.BooleanField()
+
+    def create(self, validated_data):
+        return ("dog", validated_data)
+
+
+class PetSerializer(PolymorphicSerializer):
+    serializer_classes = {"cat": CatSerializer, "dog": DogSerializer}
+
+
+def test_run_validation():
+    serializer = PetSerializer()
+
+    assert serializer.run_validation({"type": "cat", "name": "Tom", "lives": "9"}) == {
+        "type": "cat",
+        "name": "Tom",
+        "lives": 9,
+    }
+    assert serializer.run_validation({"type": "dog", "name": "Rex", "good": "y"}) == {
+        "type": "dog",
+        "name": "Rex",
+        "good": True,
+    }
+
+
+@pytest.mark.parametrize("data", [{"name": "Tom"}, {"type": "cow"}, {"type": []}])
+def test_run_validation_invalid_type(data):
+    serializer = PetSerializer()
+
+    with pytest.raises(ValidationError) as e:
+        serializer.run_validation(data)
+
+    assert e.value.errors == {"type": ["Not a valid type."]}
+
+
+def test_run_validation_not_a_dict():
+    with pytest.raises(ValidationError) as e:
+        PetSerializer().run_validation([])
+
+    assert e.value.errors == ["Expected an object."]
+
+
+def test_to_representation():
+    class Dog(object):
+        type = "dog"
+        name = "Rex"
+        good = True
+
+    serializer = PetSerializer()
+
+    assert serializer.to_representation({"type": "cat", "name": "Tom", "lives": 9}) == {
+        "type": "cat",
+        "name": "Tom",
+        "lives": 9,
+    }
+    assert serializer.to_representation(Dog()) == {
+        "type": "dog",
+        "name": "Rex",
+        "good": True,
+    }
+
+
+def test_serializers_are_reused():
+    serializer = PetSerializer()
+    cat_serializer = serializer.serializers["cat"]
+
+    serializer.run_validation({"type": "cat", "name": "Tom", "lives": 9})
+    serializer.to_representation({"type": "cat", "name": "Tom", "lives": 9})
+
+    assert serializer.serializers["cat"] is cat_serializer
+    assert cat_serializer.parent is serializer
+
+
+def test_list():
+    serializer = ListSerializer(
+        child=PetSerializer(),
+        data=[
+            {"type": "cat", "name": "Tom", "lives": 9},
+            {"type": "dog", "name": "Rex", "good": False},
+        ],
+    )
+
+    assert serializer.is_valid()
+    assert serializer.create(serializer.validated_data) == [
+        ("cat", {"type": "cat", "name": "Tom", "lives": 9}),
+        ("dog", {"type": "dog", "name": "Rex", "good": False}),
+    ]
+
+
+def test_type_field():
+    serializer = PetSerializer(type_field="kind")
+
+    assert serializer.run_validation({"kind": "cat", "name": "Tom", "lives": 9}) == {
+        "kind": "cat",
+        "name": "Tom",
+        "lives": 9,
+    }
+
+
+def test_row_type():
+    class SlotsCatSerializer(CatSerializer):
+        class Meta:
+            row_type = "slots"
+
+    class TypedCatSerializer(CatSerializer):
+        type = fields.StringField()
+
+        class Meta:
+            row_type = "slots"
+
+    class RowPetSerializer(PolymorphicSerializer):
+        serializer_classes = {"cat": SlotsCatSerializer, "typed": TypedCatSerializer}
+
+    serializer = RowPetSerializer()
+    data = {"type": "cat", "name": "Tom", "lives": "9"}
+
+    expected = {"type": "cat", "name": "Tom", "lives": 9}
+
+    assert dict(serializer.run_validation(data)) == expected
+    assert (
+        dict(ListSerializer(child=RowPetSerializer()).run_validation([data])[0])
+        == expected
+    )
+
+    value = serializer.run_validation({"type": "typed", "name": "Tom", "lives": "9"})
+    assert value["type"] == "typed"
+
+
+@pytest.mark.parametrize("row_type", ["slots", "tuple"])
+def test_row_type_save(row_type):
+    class RowCatSerializer(CatSerializer):
+        Meta = type("Meta", (), {"row_type": row_type})
+
+    class RowPetSerializer(PolymorphicSerializer):
+        serializer_classes = {"cat": RowCatSerializer, "dog": DogSerializer}
+
+    serializer = RowPetSerializer(data={"type": "cat", "name": "Tom", "lives": "9"})
+    assert serializer.is_valid(), serializer.errors
+    assert serializer.validated_data["type"] == "cat"
+
+    assert serializer.save() == ("cat", {"type": "cat", "name": "Tom", "lives": 9})
+
+
+def test_fail_fast():
+    data = {"type": "cat", "name": None, "lives": "a"}
+
+    with pytest.raises(ValidationError) as e:
+        PetSerializer().run_validation(data, fail_fast=True)
+
+    assert list(e.value.errors) == ["name"]
+    assert e.value.truncated
+
+    with pytest.raises(ValidationError) as e:
+        ListSerializer(child=PetSerializer()).run_validation([data], max_errors=1)
+
+    assert list(e.value.errors[0]) == ["name"]
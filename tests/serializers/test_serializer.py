@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 import pytest
 
-from cornflake.serializers import Serializer
+from cornflake.serializers import Serializer, parse_fieldset
 from cornflake import fields
+from cornflake.cache import LRUCache
 from cornflake.exceptions import ValidationError, SkipField
 
 
@@ -257,3 +259,409 @@ def test_data():
     serializer = FooSerializer(instance, data={"foo": "hello"})
     assert not serializer.is_valid()
     assert serializer.data == data
+
+
+@pytest.mark.parametrize(
+    ("paths", "expected"),
+    [
+        (None, None),
+        ([], {}),
+        (["foo"], {"foo": None}),
+        (["foo", "bar.baz"], {"foo": None, "bar": {"baz": None}}),
+        (["bar.baz", "bar.qux"], {"bar": {"baz": None, "qux": None}}),
+        (["bar", "bar.baz"], {"bar": None}),
+        ({"foo": None}, {"foo": None}),
+    ],
+)
+def test_parse_fieldset(paths, expected):
+    assert parse_fieldset(paths) == expected
+
+
+def test_to_representation_only():
+    class FooField(fields.Field):
+        def get_attribute(self, instance):
+            raise AssertionError("Shouldn't be evaluated")
+
+    class FooSerializer(Serializer):
+        a = fields.IntegerField()
+        b = fields.IntegerField()
+        c = FooField()
+
+    class BarSerializer(Serializer):
+        foo = FooSerializer()
+        x = fields.IntegerField()
+        y = FooField()
+
+    instance = {"foo": {"a": 1, "b": 2}, "x": 3}
+    serializer = BarSerializer(instance, only=["foo.a", "x"])
+
+    assert serializer.data == {"foo": {"a": 1}, "x": 3}
+    assert serializer.to_representation(instance, only=["foo.b"]) == {"foo": {"b": 2}}
+
+
+def test_to_representation_exclude():
+    class FooSerializer(Serializer):
+        a = fields.IntegerField()
+        b = fields.IntegerField()
+
+    class BarSerializer(Serializer):
+        foo = FooSerializer()
+        x = fields.IntegerField()
+
+    instance = {"foo": {"a": 1, "b": 2}, "x": 3}
+    serializer = BarSerializer(instance, exclude=["foo.a"])
+
+    assert serializer.data == {"foo": {"b": 2}, "x": 3}
+    assert serializer.to_representation(instance, exclude=["foo"]) == {"x": 3}
+    assert serializer.to_representation(
+        instance, only=["foo", "x"], exclude=["foo.b"]
+    ) == {"foo": {"a": 1}, "x": 3}
+
+
+def test_representation_cache():
+    class CountingField(fields.Field):
+        calls = 0
+
+        def to_representation(self, value):
+            CountingField.calls += 1
+            return value
+
+    class FooSerializer(Serializer):
+        id = fields.IntegerField()
+        foo = CountingField()
+
+        class Meta:
+            cache = LRUCache()
+            cache_version = "version"
+
+    serializer = FooSerializer()
+
+    assert serializer.to_representation({"id": 1, "version": 1, "foo": "a"}) == {
+        "id": 1,
+        "foo": "a",
+    }
+    assert serializer.to_representation({"id": 1, "version": 1, "foo": "b"}) == {
+        "id": 1,
+        "foo": "a",
+    }
+    assert CountingField.calls == 1
+
+    # New version
+    assert serializer.to_representation({"id": 1, "version": 2, "foo": "b"}) == {
+        "id": 1,
+        "foo": "b",
+    }
+    assert CountingField.calls == 2
+
+    # Sparse fieldsets bypass the cache
+    assert serializer.to_representation(
+        {"id": 1, "version": 2, "foo": "c"}, only=["foo"]
+    ) == {"foo": "c"}
+
+    # No primary key
+    serializer.to_representation({"id": None, "foo": "d"})
+    serializer.to_representation({"id": None, "foo": "d"})
+    assert CountingField.calls == 5
+
+    FooSerializer.invalidate_cache({"id": 1})
+    assert serializer.to_representation({"id": 1, "version": 2, "foo": "e"}) == {
+        "id": 1,
+        "foo": "e",
+    }
+
+
+def test_representation_cache_save():
+    class FooSerializer(Serializer):
+        id = fields.IntegerField()
+        foo = fields.StringField()
+
+        class Meta:
+            cache = LRUCache()
+
+        def update(self, instance, validated_data):
+            instance.update(validated_data)
+            return instance
+
+    instance = {"id": 1, "foo": "a"}
+    assert FooSerializer(instance).data == {"id": 1, "foo": "a"}
+
+    serializer = FooSerializer(instance, data={"id": 1, "foo": "b"})
+    assert serializer.is_valid()
+    serializer.save()
+
+    assert FooSerializer(instance).data == {"id": 1, "foo": "b"}
+
+
+def test_data_cached():
+    class CountingField(fields.Field):
+        calls = 0
+
+        def to_representation(self, value):
+            CountingField.calls += 1
+            return value
+
+    class FooSerializer(Serializer):
+        foo = CountingField()
+
+        def create(self, validated_data):
+            return dict(validated_data)
+
+        def update(self, instance, validated_data):
+            return dict(instance, **validated_data)
+
+    serializer = FooSerializer({"foo": 1})
+
+    assert serializer.data == {"foo": 1}
+    assert serializer.data is not serializer.data
+    assert CountingField.calls == 1
+
+    serializer.instance = {"foo": 2}
+    assert serializer.data == {"foo": 2}
+    assert CountingField.calls == 2
+
+    serializer = FooSerializer(data={"foo": 3})
+    assert serializer.data == {"foo": None}
+    assert serializer.is_valid()
+    assert serializer.data == {"foo": 3}
+
+    serializer.save(foo=4)
+    assert serializer.data == {"foo": 4}
+
+    # Changing the data doesn't change the cached data
+    serializer = FooSerializer({"foo": [1]})
+    serializer.data["foo"].append(2)
+    assert serializer.data == {"foo": [1]}
+
+
+def test_partial():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.IntegerField()
+        baz = fields.IntegerField()
+
+        def validate(self, data):
+            if data["foo"] > data["bar"]:
+                raise ValidationError({"foo": "Must be less than bar."})
+
+            return data
+
+    instance = {"foo": 1, "bar": 2, "baz": "not validated"}
+
+    serializer = FooSerializer(instance, data={"bar": "3"}, partial=True)
+    assert serializer.is_valid()
+    assert serializer.validated_data == {"bar": 3}
+
+    serializer = FooSerializer(instance, data={"foo": "3"}, partial=True)
+    assert not serializer.is_valid()
+    assert serializer.errors == {"foo": ["Must be less than bar."]}
+
+    serializer = FooSerializer(instance, data={"foo": None}, partial=True)
+    assert not serializer.is_valid()
+    assert serializer.errors == {"foo": ["This field is required."]}
+
+
+def test_partial_lazy():
+    class Instance(object):
+        foo = 1
+
+        @property
+        def bar(self):
+            raise AssertionError("Shouldn't be read")
+
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.IntegerField()
+
+    serializer = FooSerializer(Instance(), data={"foo": 2}, partial=True)
+    assert serializer.is_valid()
+    assert serializer.validated_data == {"foo": 2}
+
+
+def test_partial_pre_validate():
+    class AddressSerializer(Serializer):
+        country = fields.StringField()
+        postcode = fields.StringField()
+        region = fields.StringField(required=False)
+
+        def pre_validate(self, value):
+            if value["country"] == "GB" and value["postcode"]:
+                value["region"] = " UK "
+
+            return value
+
+    instance = {"country": "GB", "postcode": "A1", "region": None}
+
+    serializer = AddressSerializer(instance, data={"postcode": "X1"}, partial=True)
+    assert serializer.is_valid()
+    assert serializer.validated_data == {"postcode": "X1", "region": "UK"}
+
+
+@pytest.mark.parametrize("row_type", ["slots", "tuple"])
+def test_row_type(row_type):
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+
+        class Meta:
+            pass
+
+        def create(self, validated_data):
+            return dict(validated_data)
+
+    class BarSerializer(Serializer):
+        bar = fields.IntegerField()
+        foo = FooSerializer()
+
+        class Meta:
+            pass
+
+        def create(self, validated_data):
+            return dict(validated_data)
+
+    FooSerializer.Meta.row_type = row_type
+    BarSerializer.Meta.row_type = row_type
+
+    serializer = BarSerializer(data={"bar": "1", "foo": {"foo": "2"}})
+    assert serializer.is_valid()
+
+    validated_data = serializer.validated_data
+    assert not isinstance(validated_data, dict)
+    assert not isinstance(validated_data["foo"], dict)
+    assert validated_data == {"bar": 1, "foo": {"foo": 2}}
+    assert serializer.data == {"bar": 1, "foo": {"foo": 2}}
+
+    instance = serializer.save(baz=3)
+    assert instance["bar"] == 1
+    assert instance["baz"] == 3
+
+
+def test_check():
+    class FooField(fields.Field):
+        def to_internal_value(self, data):
+            return self.context.get("prefix", "") + data
+
+    class FooSerializer(Serializer):
+        foo = FooField()
+        bar = fields.IntegerField()
+
+    result = FooSerializer.check({"foo": "a", "bar": "1"}, context={"prefix": "x"})
+
+    assert result
+    assert result.is_valid
+    assert result.validated_data == {"foo": "xa", "bar": 1}
+    assert result.errors == {}
+    result.raise_for_errors()
+
+    result = FooSerializer.check({"foo": "a", "bar": "b"})
+
+    assert not result
+    assert result.validated_data == {}
+    assert result.errors == {"bar": ["A valid integer is required."]}
+
+    with pytest.raises(ValidationError) as e:
+        result.raise_for_errors()
+
+    assert e.value.errors == {"bar": ["A valid integer is required."]}
+
+    assert FooSerializer.get_shared() is FooSerializer.get_shared()
+
+
+def test_check_partial():
+    class FooSerializer(Serializer):
+        foo = fields.IntegerField()
+        bar = fields.IntegerField()
+
+    result = FooSerializer.check(
+        {"bar": "2"}, instance={"foo": 1, "bar": 1}, partial=True
+    )
+
+    assert result.validated_data == {"bar": 2}
+
+    with pytest.raises(AssertionError):
+        FooSerializer.check({"bar": "2"}, instance={"foo": 1, "bar": 1})
+
+    with pytest.raises(AssertionError):
+        FooSerializer.check({"bar": "2"}, partial=True)
+
+
+def test_check_threads():
+    class FooField(fields.Field):
+        def to_internal_value(self, data):
+            return (self.context["thread"], data)
+
+    class FooSerializer(Serializer):
+        foo = FooField()
+
+    def check(i):
+        return FooSerializer.check({"foo": i}, context={"thread": i}).validated_data
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(check, range(100)))
+
+    assert results == [{"foo": (i, i)} for i in range(100)]
+
+
+def test_check_context_other_serializer():
+    class BarSerializer(Serializer):
+        bar = fields.StringField()
+
+        def validate_bar(self, value):
+            return self.context["prefix"] + value
+
+    class FooSerializer(Serializer):
+        foo = fields.StringField()
+
+        def validate_foo(self, value):
+            # A serializer made during the call keeps its own context
+            serializer = BarSerializer(data={"bar": value}, context={"prefix": "y"})
+            serializer.is_valid(raise_exception=True)
+            return self.context["prefix"] + serializer.validated_data["bar"]
+
+    result = FooSerializer.check({"foo": "a"}, context={"prefix": "x"})
+
+    assert result.validated_data == {"foo": "xya"}
+
+
+def test_trusted():
+    class FooSerializer(Serializer):
+        foo = fields.StringField()
+        bar = fields.DateField()
+        baz = fields.ListField(child=fields.IntegerField())
+
+        class Meta:
+            trusted = True
+
+    serializer = FooSerializer()
+    assert serializer.fields["baz"].child.is_trusted()
+
+    data = {"foo": " a ", "bar": date(2016, 1, 1), "baz": [1, "2"]}
+    value = serializer.run_validation(data)
+    assert value == {"foo": " a ", "bar": date(2016, 1, 1), "baz": [1, 2]}
+
+    with pytest.raises(ValidationError) as e:
+        serializer.run_validation({"foo": "a", "bar": "x", "baz": []})
+
+    assert list(e.value.errors) == ["bar"]
+
+    assert not FooSerializer(trusted=False).fields["foo"].is_trusted()
+    assert not Serializer().is_trusted()
+
+
+def test_representation_cache_copied():
+    class FooSerializer(Serializer):
+        id = fields.IntegerField()
+        foo = fields.Field()
+
+        class Meta:
+            cache = LRUCache()
+
+    instance = {"id": 1, "foo": {"bar": "a"}}
+
+    data = FooSerializer(instance).data
+    data["foo"]["bar"] = "b"
+    data["baz"] = "c"
+
+    data = FooSerializer(instance).data
+    assert data == {"id": 1, "foo": {"bar": "a"}}
+
+    data["foo"]["bar"] = "b"
+    assert FooSerializer(instance).data == {"id": 1, "foo": {"bar": "a"}}
@@ -0,0 +1,216 @@
+import io
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import Column, Integer, String, inspect  # noqa: E402
+from sqlalchemy.orm import DeclarativeBase  # noqa: E402
+from sqlalchemy.orm.attributes import set_committed_value  # noqa: E402
+
+from cornflake import fields  # noqa: E402
+from cornflake.exceptions import ErrorSummary, ValidationError  # noqa: E402
+from cornflake.ingest import ingest  # noqa: E402
+from cornflake.sqlalchemy_orm import ModelSerializer  # noqa: E402
+from cornflake.validators import not_empty  # noqa: E402
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Patient(Base):
+    __tablename__ = "patients"
+
+    id = Column(Integer, primary_key=True)
+    first_name = Column(String)
+    last_name = Column(String)
+
+
+class PatientSerializer(ModelSerializer):
+    class Meta(object):
+        model_class = Patient
+
+
+class ChangedPatientSerializer(ModelSerializer):
+    class Meta(object):
+        model_class = Patient
+        write_changes_only = True
+
+
+def test_create():
+    serializer = PatientSerializer(data={"first_name": "John", "last_name": "Smith"})
+    assert serializer.is_valid()
+
+    patient = serializer.save(unknown="x")
+
+    assert isinstance(patient, Patient)
+    assert patient.first_name == "John"
+    assert patient.last_name == "Smith"
+    assert serializer.changed_fields == {"first_name", "last_name"}
+
+
+def test_update():
+    patient = Patient(id=1, first_name="John", last_name="Smith")
+
+    serializer = PatientSerializer(
+        patient, data={"first_name": "John", "last_name": "Jones"}
+    )
+    assert serializer.is_valid()
+    serializer.save()
+
+    assert patient.last_name == "Jones"
+    assert serializer.changed_fields == {"first_name", "last_name"}
+
+
+def test_update_write_changes_only():
+    # Simulate a patient loaded from the database
+    patient = Patient()
+    set_committed_value(patient, "id", 1)
+    set_committed_value(patient, "first_name", "John")
+    set_committed_value(patient, "last_name", "Smith")
+
+    serializer = ChangedPatientSerializer(
+        patient, data={"first_name": "John", "last_name": "Jones"}
+    )
+    assert serializer.is_valid()
+    serializer.save()
+
+    assert patient.last_name == "Jones"
+    assert serializer.changed_fields == {"last_name"}
+    assert not inspect(patient).attrs.first_name.history.has_changes()
+    assert inspect(patient).attrs.last_name.history.added == ["Jones"]
+
+
+class IntoPatientSerializer(ModelSerializer):
+    last_name = fields.StringField(validators=[not_empty()])
+
+    class Meta(object):
+        model_class = Patient
+        validate_into_instance = True
+
+    def validate(self, data):
+        if data["first_name"] == data["last_name"]:
+            raise ValidationError({"last_name": "Same as first name."})
+
+        return data
+
+
+def test_validate_into_instance_create():
+    serializer = IntoPatientSerializer(
+        data={"first_name": "John", "last_name": "Smith"}
+    )
+    assert serializer.is_valid()
+    assert isinstance(serializer.validated_data, Patient)
+
+    patient = serializer.save()
+
+    assert patient is serializer.validated_data
+    assert patient.first_name == "John"
+    assert patient.last_name == "Smith"
+    assert serializer.changed_fields == {"first_name", "last_name"}
+
+
+def test_validate_into_instance_update():
+    patient = Patient(id=1, first_name="John", last_name="Smith")
+
+    serializer = IntoPatientSerializer(
+        patient, data={"first_name": "John", "last_name": "Jones"}
+    )
+    assert serializer.is_valid()
+    assert serializer.validated_data is patient
+    assert patient.last_name == "Jones"
+    assert serializer.save() is patient
+
+
+@pytest.mark.parametrize(
+    ("data", "errors"),
+    [
+        (
+            {"first_name": "Jane", "last_name": ""},
+            {"last_name": ["This field is required."]},
+        ),
+        (
+            {"first_name": "Jones", "last_name": "Jones"},
+            {"last_name": ["Same as first name."]},
+        ),
+    ],
+)
+def test_validate_into_instance_rollback(data, errors):
+    patient = Patient(id=1, first_name="John", last_name="Smith")
+
+    serializer = IntoPatientSerializer(patient, data=data)
+    assert not serializer.is_valid()
+    assert serializer.errors == errors
+    assert patient.first_name == "John"
+    assert patient.last_name == "Smith"
+
+
+def test_validate_into_instance_collector():
+    patient = Patient(id=1, first_name="John", last_name="Smith")
+    collector = ErrorSummary()
+
+    serializer = IntoPatientSerializer(
+        patient, data={"first_name": "Jane", "last_name": ""}
+    )
+    assert not serializer.is_valid(collector=collector, fail_fast=True)
+    assert collector.count == 1
+    assert serializer.errors == collector.errors
+    assert not serializer.truncated
+
+    with pytest.raises(ValidationError):
+        serializer.is_valid(raise_exception=True)
+
+    assert patient.first_name == "John"
+
+
+def test_run_validation_fail_fast():
+    with pytest.raises(ValidationError) as e:
+        IntoPatientSerializer().run_validation(
+            {"first_name": "John", "last_name": ""}, fail_fast=True
+        )
+
+    assert e.value.errors == {"last_name": ["This field is required."]}
+
+
+def test_validate_into_instance_rollback_other_errors():
+    class FailingSerializer(IntoPatientSerializer):
+        def validate(self, data):
+            raise RuntimeError("Lookup failed")
+
+    patient = Patient(id=1, first_name="John", last_name="Smith")
+    serializer = FailingSerializer(
+        patient, data={"first_name": "Jane", "last_name": "Smith"}
+    )
+
+    with pytest.raises(RuntimeError):
+        serializer.is_valid()
+
+    assert patient.first_name == "John"
+
+
+def test_run_instance_validation():
+    patient = Patient(id=1, first_name="John", last_name="Smith")
+    serializer = IntoPatientSerializer()
+
+    value = serializer.run_instance_validation(
+        {"first_name": "John", "last_name": "Jones"}, patient
+    )
+
+    assert value.instance is patient
+    assert value.changed_fields == {"first_name", "last_name"}
+    assert serializer.changed_fields == set()
+
+
+def test_ingest():
+    valid = []
+    errors = []
+    result = ingest(
+        io.StringIO("id,first_name,last_name\n1,John,Smith\n"),
+        PatientSerializer,
+        valid.extend,
+        errors.extend,
+    )
+
+    assert (result.valid, errors) == (1, [])
+    assert valid == [{"first_name": "John", "last_name": "Smith"}]